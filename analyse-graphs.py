@@ -0,0 +1,40 @@
+import argparse
+import sys
+
+from functions.report import ANALYSES, analyse_files, expand_paths
+
+
+def parse_arguments():
+    """
+    Returns the command line arguments.
+    """
+
+    parser = argparse.ArgumentParser(description="Analyses many graph files and writes one JSON report per file.")
+    parser.add_argument("files", nargs="+", help=".txt files or glob patterns, like 'txt-files/*.txt'")
+    parser.add_argument("--analyses", nargs="+", choices=list(ANALYSES), default=list(ANALYSES))
+    parser.add_argument("--output", default="reports", help="directory of the reports")
+    parser.add_argument("--workers", type=int, help="number of worker processes, 1 to run in this process")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    paths = expand_paths(args.files)
+    if not paths:
+        print("No file found!")
+        sys.exit(1)
+
+    failed = 0
+    try:
+        for path, output, error in analyse_files(paths, args.analyses, args.output, args.workers):
+            if error is None:
+                print(f"{path}: {output}")
+            else:
+                failed += 1
+                print(f"{path}: {error}")
+    except ValueError as e:
+        print(f"Reports would overwrite each other! {e}")
+        sys.exit(1)
+    print(f"Done! {len(paths) - failed} of {len(paths)} files analysed")
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,38 @@
+import glob
+import sys
+import time
+
+from functions.weighted_graph import GraphWeighted
+
+
+def benchmark_vertex_cover(files, time_limit):
+    """
+    Compares the heuristic vertex covers with the exact one on each file.
+
+    Parameters
+    ----------
+    files : list
+        the .txt graph files.
+    time_limit : float
+        the maximum number of seconds of each exact search.
+    """
+
+    print(f"{'file':<30}{'greedy':>8}{'matching':>10}{'exact':>8}{'optimal':>9}{'greedy s':>10}{'exact s':>10}")
+    for file in files:
+        graph = GraphWeighted.from_txt(file)
+
+        start = time.perf_counter()
+        greedy = graph.vertex_cover("greedy")
+        greedy_time = time.perf_counter() - start
+        matching = graph.vertex_cover("matching")
+        start = time.perf_counter()
+        exact = graph.vertex_cover("exact", time_limit)
+        exact_time = time.perf_counter() - start
+
+        print(f"{file:<30}{greedy.size:>8}{matching.size:>10}{exact.size:>8}{str(exact.optimal):>9}"
+              f"{greedy_time:>10.4f}{exact_time:>10.4f}")
+
+
+if __name__ == "__main__":
+    files = sys.argv[1:] or sorted(f for f in glob.glob("txt-files/*.txt") if "MST" not in f)
+    benchmark_vertex_cover(files, 60)
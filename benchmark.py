@@ -0,0 +1,64 @@
+import argparse
+import sys
+
+from functions.benchmark import METHODS, check_scaling, compare_results, load_results, run_benchmarks, save_results
+
+
+def parse_arguments():
+    """
+    Returns the command line arguments.
+    """
+
+    parser = argparse.ArgumentParser(description="Times every GraphWeighted method on graphs of increasing size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 500, 1000, 2000])
+    parser.add_argument("--degrees", type=float, nargs="+", default=[4, 16])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--quadratic-limit", type=int, default=1000,
+                        help="largest number of vertices for the O(V * E) methods")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--methods", nargs="+",
+                        choices=["from_txt", "text_to_json", "json_to_text"] + [name for name, _, _ in METHODS],
+                        help="methods to time, all by default")
+    parser.add_argument("--output", default="benchmark-results.json", help=".json or .csv file")
+    parser.add_argument("--baseline", help="saved results to compare with")
+    parser.add_argument("--threshold", type=float, default=1.5,
+                        help="slowdown ratio reported as a regression")
+    parser.add_argument("--max-exponent", type=float,
+                        help="fail if a linear method grows faster than (n + m) ** exponent")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    results = run_benchmarks(args.sizes, args.degrees, args.repeat, args.quadratic_limit, args.seed,
+                             args.methods)
+    save_results(results, args.output)
+
+    print(f"{'method':<32}{'kind':<6}{'n':>8}{'m':>9}{'seconds':>12}")
+    for r in results:
+        print(f"{r['method']:<32}{r['kind']:<6}{r['n']:>8}{r['m']:>9}{r['seconds']:>12.6f}")
+    print(f"\nResults written to {args.output}")
+
+    failed = False
+    if args.max_exponent is not None:
+        slow = check_scaling(results, args.max_exponent)
+        if slow:
+            failed = True
+            print("\nMethods growing too fast")
+            for method, kind, small, large, k in slow:
+                print(f"{method} on {kind}: {small['seconds']:.6f}s at n={small['n']} -> "
+                      f"{large['seconds']:.6f}s at n={large['n']} (exponent {k:.2f})")
+        else:
+            print(f"\nEvery linear method grows at most as (n + m) ** {args.max_exponent}")
+
+    if args.baseline:
+        regressions = compare_results(results, load_results(args.baseline), args.threshold)
+        if regressions:
+            print("\nRegressions")
+            for r, old, ratio in regressions:
+                print(f"{r['method']} on {r['kind']} {r['params']}: {old:.6f}s -> {r['seconds']:.6f}s ({ratio:.2f}x)")
+            failed = True
+        else:
+            print("\nNo regressions against the baseline")
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,299 @@
+import csv
+import json
+import math
+import os
+import tempfile
+import time
+
+from functions.converter import json_to_text, text_to_json
+from functions.generators import generate_file
+from functions.weighted_graph import GraphWeighted
+
+
+def last_vertex(graph):
+    """
+    Returns the last vertex of the graph, used as target of the pair queries.
+    """
+
+    return graph.vertex_list()[-1]
+
+
+# (nome, função, custo): os de custo "quadratic" são O(V * E) ou piores e só
+# rodam até o limite de vértices configurado
+METHODS = [
+    ("get_order", lambda g: g.get_order(), "linear"),
+    ("size", lambda g: g.size(), "linear"),
+    ("get_neighbours", lambda g: [g.get_neighbours(v) for v in g.vertex_list()], "linear"),
+    ("degree_of_vertex", lambda g: [g.degree_of_vertex(v) for v in g.vertex_list()], "linear"),
+    ("degree_sequence", lambda g: g.degree_sequence(), "linear"),
+    ("dfs", lambda g: g.dfs(g.get_first_vertex()), "linear"),
+    ("bfs", lambda g: g.bfs(g.get_first_vertex()), "linear"),
+    ("dfs_not_visited", lambda g: g.dfs_not_visited(), "linear"),
+    ("connected_components", lambda g: g.connected_components(), "linear"),
+    ("has_cycle", lambda g: g.has_cycle(), "linear"),
+    ("dijkstra", lambda g: g.dijkstra(g.get_first_vertex()), "linear"),
+    ("eccentricity", lambda g: g.eccentricity(g.get_first_vertex()), "linear"),
+    ("minimum_path", lambda g: g.minimum_path(g.get_first_vertex(), last_vertex(g)), "linear"),
+    ("closeness_centrality", lambda g: g.closeness_centrality(g.get_first_vertex()), "linear"),
+    ("minimum_vertex_cover_heuristic", lambda g: g.minimum_vertex_cover_heuristic(), "linear"),
+    ("vertex_cover_matching", lambda g: g.vertex_cover("matching"), "linear"),
+    ("minimum_spanning_tree", lambda g: g.minimum_spanning_tree("txt-files/bench.txt"), "linear"),
+    ("minimum_spanning_forest", lambda g: g.minimum_spanning_forest(), "linear"),
+    ("maximum_matching", lambda g: g.maximum_matching(), "linear"),
+    ("bellman_ford", lambda g: g.bellman_ford(g.get_first_vertex()), "quadratic"),
+    ("radius", lambda g: g.radius(), "quadratic"),
+    ("diameter", lambda g: g.diameter(), "quadratic"),
+    ("center", lambda g: g.center(), "quadratic"),
+    ("all_closeness", lambda g: g.all_closeness(), "quadratic"),
+    ("all_closeness_sampled", lambda g: g.all_closeness(epsilon=0.2, seed=0), "quadratic"),
+    ("betweenness_centrality", lambda g: g.betweenness_centrality(), "quadratic"),
+    ("betweenness_centrality_sampled", lambda g: g.betweenness_centrality(k=32, seed=0), "linear"),
+]
+
+
+def time_call(function, repeat, setup=None):
+    """
+    Returns the best time of some calls of a function.
+
+    Parameters
+    ----------
+    function : callable
+        the function to time.
+    repeat : int
+        the number of calls.
+    setup : callable or None
+        called before each call, outside the timing.
+
+    Returns
+    -------
+    the smallest time in seconds.
+    """
+
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_graph(kind, params, repeat, quadratic_limit, seed=0, methods=None):
+    """
+    Times every method and the converters on one generated graph.
+
+    Must run inside a directory with txt-files and json-files folders,
+    because the converters write there.
+
+    Parameters
+    ----------
+    kind : str
+        the kind of graph, see functions.generators.workload.
+    params : dict
+        the parameters of the kind.
+    repeat : int
+        the number of calls of each method, the best is kept.
+    quadratic_limit : int
+        the largest number of vertices for the quadratic methods.
+    seed : int
+        the seed of the generator.
+    methods : list or None
+        the names of the methods to time, by default all of them.
+
+    Returns
+    -------
+    list of result records.
+    """
+
+    path = generate_file(kind, "txt-files/bench.txt", seed, **params)
+    graph = GraphWeighted.from_txt(path)
+    n = graph.get_order()
+    m = graph.size()
+    case = {"kind": kind, "params": json.dumps(params, sort_keys=True), "n": n, "m": m}
+
+    results = []
+
+    def record(method, function, setup=None):
+        if methods is None or method in methods:
+            results.append(dict(case, method=method, seconds=time_call(function, repeat, setup)))
+
+    record("from_txt", lambda: GraphWeighted.from_txt(path))
+    for name, function, cost in METHODS:
+        if cost == "quadratic" and n > quadratic_limit:
+            continue
+        record(name, lambda: function(graph), graph.clear_cache)
+    record("text_to_json", lambda: text_to_json(path, "bench"))
+    record("json_to_text", lambda: json_to_text("json-files/bench.json", "bench-copy"))
+    return results
+
+
+def run_benchmarks(sizes, degrees, repeat=3, quadratic_limit=2000, seed=0, methods=None):
+    """
+    Times every method on graphs of increasing size and density.
+
+    For each size there is one G(n, p) graph per average degree plus a path,
+    which is the worst case of the traversals.
+
+    Parameters
+    ----------
+    sizes : list
+        the numbers of vertices.
+    degrees : list
+        the average degrees of the G(n, p) graphs.
+    repeat : int
+        the number of calls of each method, the best is kept.
+    quadratic_limit : int
+        the largest number of vertices for the quadratic methods.
+    seed : int
+        the seed of the generators.
+    methods : list or None
+        the names of the methods to time, by default all of them.
+
+    Returns
+    -------
+    list of result records.
+    """
+
+    cases = []
+    for n in sizes:
+        for d in degrees:
+            cases.append(("gnp", {"n": n, "p": min(1.0, d / max(1, n - 1))}))
+        cases.append(("path", {"n": n}))
+
+    results = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            os.mkdir("txt-files")
+            os.mkdir("json-files")
+            for kind, params in cases:
+                results += benchmark_graph(kind, params, repeat, quadratic_limit, seed, methods)
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def save_results(results, path):
+    """
+    Saves the result records to a .json or .csv file.
+
+    Parameters
+    ----------
+    results : list
+        the result records.
+    path : str
+        the file, csv if it ends with .csv and json otherwise.
+    """
+
+    if path.endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["method", "kind", "params", "n", "m", "seconds"])
+            writer.writeheader()
+            writer.writerows(results)
+    else:
+        with open(path, "w") as f:
+            json.dump(results, f, indent=1)
+
+
+def load_results(path):
+    """
+    Loads result records saved by save_results.
+
+    Parameters
+    ----------
+    path : str
+        the .json or .csv file.
+
+    Returns
+    -------
+    list of result records.
+    """
+
+    with open(path, newline="") as f:
+        if path.endswith(".csv"):
+            results = list(csv.DictReader(f))
+            for r in results:
+                r["n"] = int(r["n"])
+                r["m"] = int(r["m"])
+                r["seconds"] = float(r["seconds"])
+            return results
+        return json.load(f)
+
+
+def compare_results(results, baseline, threshold=1.5, minimum=0.001):
+    """
+    Returns the results that got slower than the baseline.
+
+    Parameters
+    ----------
+    results : list
+        the new result records.
+    baseline : list
+        the saved result records.
+    threshold : float
+        the ratio new / baseline above which a result is a regression.
+    minimum : float
+        results faster than this in both runs are ignored as noise.
+
+    Returns
+    -------
+    list of (record, baseline seconds, ratio) of the regressions.
+    """
+
+    saved = {(r["method"], r["kind"], r["params"]): r["seconds"] for r in baseline}
+    regressions = []
+    for r in results:
+        old = saved.get((r["method"], r["kind"], r["params"]))
+        if old is None or max(old, r["seconds"]) < minimum:
+            continue
+        ratio = r["seconds"] / old if old > 0 else float("inf")
+        if ratio > threshold:
+            regressions.append((r, old, ratio))
+    return regressions
+
+
+def check_scaling(results, exponent=1.5, minimum=0.01):
+    """
+    Returns the linear methods whose time grows faster than expected with the graph.
+
+    For each method, kind of graph and average degree, the time of the
+    smallest graph is compared with the time of the largest one, and the
+    growth is measured as the exponent k of (n + m) ** k that fits both.
+
+    Parameters
+    ----------
+    results : list
+        the result records, with at least two sizes of each case.
+    exponent : float
+        the largest exponent accepted for the methods of cost "linear".
+    minimum : float
+        results faster than this are ignored as noise.
+
+    Returns
+    -------
+    list of (method, kind, smallest record, largest record, exponent) of the
+    methods that grow too fast.
+    """
+
+    linear = {name for name, _, cost in METHODS if cost == "linear"}
+    linear.update(("from_txt", "text_to_json", "json_to_text"))
+    cases = {}
+    for r in results:
+        if r["method"] in linear and r["seconds"] >= minimum:
+            # o p do G(n, p) muda com n, o grau médio identifica o caso
+            key = (r["method"], r["kind"], round(2 * r["m"] / max(1, r["n"])))
+            cases.setdefault(key, []).append(r)
+
+    slow = []
+    for (method, kind, _), records in cases.items():
+        small = min(records, key=lambda r: r["n"] + r["m"])
+        large = max(records, key=lambda r: r["n"] + r["m"])
+        growth = (large["n"] + large["m"]) / (small["n"] + small["m"])
+        if growth <= 1:
+            continue
+        k = math.log(large["seconds"] / small["seconds"]) / math.log(growth)
+        if k > exponent:
+            slow.append((method, kind, small, large, k))
+    return slow
@@ -0,0 +1,188 @@
+import heapq
+import math
+
+
+def closeness_from_distances(distances, n, harmonic=False):
+    """
+    Returns the closeness of a vertex from its distances to all vertices.
+
+    Closeness follows Wasserman and Faust: with r other vertices reachable at
+    total distance s it is (r / s) * (r / (n - 1)), which is (n - 1) / s on a
+    connected graph and does not drop to 0 on a disconnected one. Harmonic
+    centrality is the sum of 1 / d over the other reachable vertices.
+
+    Parameters
+    ----------
+    distances : iterable
+        the distance to every vertex, including 0 to the vertex itself and
+        inf to the unreachable ones.
+    n : int
+        the number of vertices of the graph.
+    harmonic : bool
+        whether to return the harmonic centrality.
+
+    Returns
+    -------
+    the centrality of the vertex.
+    """
+
+    inf = float("inf")
+    if harmonic:
+        return sum(1 / d for d in distances if 0 < d < inf)
+    reachable = -1
+    total = 0.0
+    for d in distances:
+        if d != inf:
+            reachable += 1
+            total += d
+    if total <= 0 or n <= 1:
+        return 0
+    return (reachable / total) * (reachable / (n - 1))
+
+
+def sample_size(n, epsilon):
+    """
+    Returns the number of sources for an Eppstein–Wang estimate.
+
+    With log(n) / epsilon² random sources every average distance is within
+    epsilon times the diameter of the exact one with high probability.
+
+    Parameters
+    ----------
+    n : int
+        the number of vertices.
+    epsilon : float
+        the allowed error, relative to the diameter.
+
+    Returns
+    -------
+    the number of sources, at most n.
+    """
+
+    return min(n, max(1, math.ceil(math.log(max(n, 2)) / (epsilon * epsilon))))
+
+
+def sampled_closeness(sums, reached, sampled, k, n, harmonic=False):
+    """
+    Returns the centralities estimated from the distances of some sampled sources.
+
+    The graph is undirected, so the distance from a sample to a vertex is
+    also the distance back. The sums over the samples are scaled to the
+    n - 1 other vertices, leaving out the sample that is the vertex itself.
+
+    Parameters
+    ----------
+    sums : list
+        for each vertex id, the sum of its finite distances to the samples, or
+        of their inverses for the harmonic centrality.
+    reached : list
+        for each vertex id, the number of samples that reach it.
+    sampled : bytearray
+        the flag of the vertex ids that are samples.
+    k : int
+        the number of samples.
+    n : int
+        the number of vertices.
+    harmonic : bool
+        whether the sums are of the harmonic centrality.
+
+    Returns
+    -------
+    list of centralities indexed by vertex id.
+    """
+
+    result = []
+    for v in range(n):
+        others = k - sampled[v]
+        if others == 0:
+            result.append(0)
+            continue
+        scale = (n - 1) / others
+        if harmonic:
+            result.append(sums[v] * scale)
+            continue
+        reachable = (reached[v] - sampled[v]) * scale
+        total = sums[v] * scale
+        result.append(0 if total <= 0 else (reachable / total) * (reachable / (n - 1)))
+    return result
+
+
+def brandes_accumulate(storage, sources, weighted=True):
+    """
+    Returns the betweenness of every vertex id accumulated from some sources (Brandes).
+
+    Each source runs one search that counts the shortest paths to every
+    vertex, then the dependencies are summed back from the farthest vertex.
+    The predecessors are found again through the adjacency instead of being
+    stored, so each search only keeps a few arrays of n entries. Every pair
+    is counted from both ends, the caller halves the result.
+
+    Parameters
+    ----------
+    storage : CSRStorage
+        the compressed storage of the graph.
+    sources : list
+        the source vertex ids.
+    weighted : bool
+        whether to use dijkstra, False to use bfs counting every edge as 1.
+
+    Returns
+    -------
+    list of partial betweenness indexed by vertex id.
+    """
+
+    offsets = storage.offsets
+    targets = storage.targets
+    weights = storage.weights
+    n = storage.vertex_count()
+    inf = float("inf")
+    centrality = [0.0] * n
+
+    for s in sources:
+        dist = [inf] * n
+        sigma = [0] * n
+        dist[s] = 0
+        sigma[s] = 1
+        if weighted:
+            order = []
+            heap = [(0, s)]
+            while heap:
+                du, u = heapq.heappop(heap)
+                if du > dist[u]:
+                    continue
+                order.append(u)
+                for e in range(offsets[u], offsets[u + 1]):
+                    t = targets[e]
+                    nd = du + weights[e]
+                    if nd < dist[t]:
+                        dist[t] = nd
+                        sigma[t] = sigma[u]
+                        heapq.heappush(heap, (nd, t))
+                    elif nd == dist[t]:
+                        sigma[t] += sigma[u]
+        else:
+            order = [s]
+            head = 0
+            while head < len(order):
+                u = order[head]
+                head += 1
+                du = dist[u] + 1
+                for t in targets[offsets[u]:offsets[u + 1]]:
+                    if dist[t] == inf:
+                        dist[t] = du
+                        order.append(t)
+                    if dist[t] == du:
+                        sigma[t] += sigma[u]
+
+        delta = [0.0] * n
+        for w in reversed(order):
+            dw = dist[w]
+            coefficient = (1 + delta[w]) / sigma[w]
+            for e in range(offsets[w], offsets[w + 1]):
+                v = targets[e]
+                # v é predecessor de w em algum caminho mínimo
+                if dist[v] + (weights[e] if weighted else 1) == dw and v != w:
+                    delta[v] += sigma[v] * coefficient
+            if w != s:
+                centrality[w] += delta[w]
+    return centrality
@@ -1,4 +1,17 @@
 import json
+import shutil
+import tempfile
+
+from functions.csr import CSRStorage
+from functions.weighted_graph import GraphWeighted
+
+# quantidade de vértices ou arestas escritos de uma vez e tamanho do buffer de escrita
+WRITE_BATCH_SIZE = 4096
+WRITE_BUFFER_SIZE = 1 << 20
+
+# quantidade de caracteres lidos por vez dos arquivos json
+READ_CHUNK_SIZE = 1 << 20
+DECODER = json.JSONDecoder()
 
 
 def vertex_list(text_file):
@@ -11,20 +24,215 @@ def vertex_list(text_file):
         text file.
     """
 
-    vertexlist = []
+    # o dicionário remove repetidos mantendo a ordem da primeira aparição
+    vertices = {}
+    with open(text_file, "r") as file:
+        file.readline()
+        for line in file:
+            columns = line.split()
+            if columns:
+                vertices[columns[0]] = None
+                vertices[columns[1]] = None
+    return list(vertices)
+
+
+class JsonStream:
+    """
+    A class used to read a json file incrementally.
+
+    ...
+
+    The file is read in chunks and only the values asked for are decoded,
+    so a big document can be walked without building the whole tree.
+
+    Attributes
+    ----------
+    file : file
+        the json file.
+    buffer : str
+        the text read and not consumed yet.
+    pos : int
+        the position of the next character in the buffer.
+    eof : bool
+        True when the whole file was read.
+
+    Methods
+    -------
+    fill(self)
+        Reads the next chunk of the file.
+
+    peek(self)
+        Returns the next character that is not whitespace.
+
+    expect(self, c)
+        Consumes the next character, that must be c.
+
+    value(self)
+        Decodes and returns the next json value.
+
+    members(self)
+        Iterates over the keys of the next json object.
+    """
+
+    def __init__(self, file):
+        """
+        Parameters
+        ----------
+        file : file
+            the json file.
+        """
+
+        self.file = file
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """
+        Reads the next chunk of the file.
+
+        Returns
+        -------
+        False if the file has ended, True otherwise.
+        """
+
+        if self.eof:
+            return False
+        chunk = self.file.read(READ_CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """
+        Returns the next character that is not whitespace.
+
+        Returns
+        -------
+        the character, or an empty string at the end of the file.
+        """
+
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self.fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, c):
+        """
+        Consumes the next character, that must be c.
+
+        Parameters
+        ----------
+        c : str
+            the expected character.
+        """
+
+        if self.peek() != c:
+            raise ValueError(f"expected {c!r} at character {self.pos} of the buffer, found {self.peek()!r}")
+        self.pos += 1
+
+    def value(self):
+        """
+        Decodes and returns the next json value.
+
+        Returns
+        -------
+        the decoded value.
+        """
+
+        self.peek()
+        while True:
+            try:
+                value, end = DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # um número no fim do buffer pode continuar no próximo pedaço
+            if end == len(self.buffer) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def members(self):
+        """
+        Iterates over the keys of the next json object.
+
+        After each key the caller must consume its value, with value() or by
+        walking into it.
+
+        Returns
+        -------
+        iterator of keys.
+        """
+
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            c = self.peek()
+            self.pos += 1
+            if c == "}":
+                return
+            if c != ",":
+                raise ValueError(f"expected ',' or '}}' in object, found {c!r}")
+
+
+def json_edges(json_file, labels):
+    """
+    Iterates over the edges of a vis.js json file without loading it whole.
+
+    Only the maps under data.nodes._data and data.edges._data are walked,
+    one entry at a time. Node labels are stored in the labels dictionary as
+    they are read. The exports list the nodes first, so every label is known
+    before the first edge. Edges found before their nodes are held until the
+    end.
 
-    file = open(text_file, "r")
-    lines = file.readlines()[1:]
+    Parameters
+    ----------
+    json_file : str
+        json file.
+    labels : dict
+        dictionary filled with the label of each node id.
+
+    Returns
+    -------
+    iterator of (from label, to label, weight label) tuples.
+    """
 
-    for line in lines:
-        first = line.split()[0]
-        second = line.split()[1]
-        if first not in vertexlist:
-            vertexlist.append(first)
-        if second not in vertexlist:
-            vertexlist.append(second)
-    file.close()
-    return vertexlist
+    pending = []
+    with open(json_file) as f:
+        stream = JsonStream(f)
+        for key in stream.members():
+            if key != "data":
+                stream.value()
+                continue
+            for section in stream.members():
+                if section not in ("nodes", "edges"):
+                    stream.value()
+                    continue
+                for field in stream.members():
+                    if field != "_data":
+                        stream.value()
+                        continue
+                    for _ in stream.members():
+                        item = stream.value()
+                        if section == "nodes":
+                            labels[item["id"]] = item["label"]
+                        elif item["from"] in labels and item["to"] in labels:
+                            yield labels[item["from"]], labels[item["to"]], item["label"]
+                        else:
+                            pending.append((item["from"], item["to"], item["label"]))
+    for a, b, w in pending:
+        yield labels[a], labels[b], w
 
 
 def json_to_text(json_file, text_file):
@@ -38,37 +246,70 @@ def json_to_text(json_file, text_file):
     text_file : str
         text file.
     """
-    vertexlist = []
 
-    with open(json_file) as f:
-        data = json.load(f)
+    labels = {}
+    with open(f"txt-files/{text_file}.txt", "w", buffering=WRITE_BUFFER_SIZE) as f:
+        batch = None
+        for a, b, w in json_edges(json_file, labels):
+            if batch is None:
+                f.write(f"{len(labels)}\n")
+                batch = []
+            batch.append(f"{a} {b} {w} \n")
+            if len(batch) == WRITE_BATCH_SIZE:
+                f.write("".join(batch))
+                batch = []
+        if batch is None:
+            f.write(f"{len(labels)}\n")
+        else:
+            f.write("".join(batch))
 
-    with open(f"txt-files/{text_file}.txt", "w") as f:
 
-        for i in data['data']['nodes']['_data']:
-            for j in data['data']['nodes']['_data'][i]:
-                if j == "label":
-                    vertexlist.append(data['data']['nodes']['_data'][i][j])
+def json_to_graph(json_file):
+    """
+    Reads a json file straight into a graph.
 
-        f.write(str(len(vertexlist)) + "\n")
+    Labels that are integers are stored as integers, like in the text files.
 
-        for i in data['data']['edges']['_data']:
-            for j in data['data']['edges']['_data'][i]:
-                if j == "from":
-                    print(vertexlist[data['data']['edges']['_data'][i][j] - 1])
-                    f.write(vertexlist[data['data']['edges']['_data'][i][j] - 1] + " ")
-                if j == "to":
-                    print(vertexlist[data['data']['edges']['_data'][i][j] - 1])
-                    f.write(vertexlist[data['data']['edges']['_data'][i][j] - 1] + " ")
-                if j == "label":
-                    f.write(data['data']['edges']['_data'][i][j] + " ")
-            f.write("\n")
+    Parameters
+    ----------
+    json_file : str
+        json file.
+
+    Returns
+    -------
+    the compact GraphWeighted.
+    """
+
+    labels = {}
+    first = []
+    second = []
+    weights = []
+    for a, b, w in json_edges(json_file, labels):
+        first.append(a)
+        second.append(b)
+        weights.append(float(w))
+
+    # os rótulos numéricos viram inteiros, como no carregamento dos .txt
+    numeric = {}
+    for label in labels.values():
+        try:
+            numeric[label] = int(label)
+        except ValueError:
+            numeric[label] = label
+    first = [numeric[a] for a in first]
+    second = [numeric[b] for b in second]
+    return GraphWeighted.from_storage(len(labels), CSRStorage.from_edge_list(first, second, weights))
 
 
 def text_to_json(text_file, json_file):
     """
     Converts a text file to a json file.
 
+    The text file is read only once. Vertices get their ids from a
+    dictionary as they first appear, and the edges are written in batches
+    to a temporary file, because the nodes must come first in the json
+    file. So only the vertex index is kept in memory.
+
     Parameters
     ----------
     text_file : str
@@ -78,45 +319,74 @@ def text_to_json(text_file, json_file):
     """
 
     text_file = str(text_file)
-    vlist = vertex_list(text_file)
-
-    with open(text_file, "r") as f:
-        lines = f.readlines()[1:]
-        with open(f"json-files/{json_file}.json", "w") as f:
-            f.write("{\n")
-            f.write('"data": {\n')
-            f.write('"nodes": {\n')
-            f.write('"_data": {\n')
-            for i in range(len(vlist)):
-                f.write(f'"{i + 1}": {{\n')
-                f.write(f'"id": {i + 1},\n')
-                f.write(f'"label": "{vlist[i]}"\n')
-                if i == len(vlist) - 1:
-                    f.write("}\n")
-                else:
-                    f.write("},\n")
-            f.write("}\n")
-            f.write("},\n")
-            f.write('"edges": {\n')
-            f.write('"_data": {\n')
-            for i in range(len(lines)):
-                f.write(f'"{i + 1}": {{\n')
-                f.write(f'"from": {vlist.index(lines[i].split()[0]) + 1},\n')
-                f.write(f'"to": {vlist.index(lines[i].split()[1]) + 1},\n')
-                f.write(f'"label": "{lines[i].split()[2]}",\n')
-                f.write(f'"id": {i + 1},\n')
-                f.write(f'"color": {{\n')
+    index = {}
+
+    with open(text_file, "r") as f, tempfile.TemporaryFile("w+") as edges:
+        f.readline()
+        batch = []
+        i = 0
+        for line in f:
+            columns = line.split()
+            if not columns:
+                continue
+            a = index.setdefault(columns[0], len(index) + 1)
+            b = index.setdefault(columns[1], len(index) + 1)
+            separator = "},\n" if i else ""
+            i += 1
+            batch.append(f'{separator}"{i}": {{\n"from": {a},\n"to": {b},\n'
+                         f'"label": "{columns[2]}",\n"id": {i},\n"color": {{\n}}\n')
+            if len(batch) == WRITE_BATCH_SIZE:
+                edges.write("".join(batch))
+                batch = []
+        edges.write("".join(batch))
+        if i:
+            edges.write("}\n")
+        edges.seek(0)
+
+        with open(f"json-files/{json_file}.json", "w", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write('{\n"data": {\n"nodes": {\n"_data": {\n')
+            batch = []
+            for label, k in index.items():
+                separator = "},\n" if k > 1 else ""
+                batch.append(f'{separator}"{k}": {{\n"id": {k},\n"label": "{label}"\n')
+                if len(batch) == WRITE_BATCH_SIZE:
+                    f.write("".join(batch))
+                    batch = []
+            f.write("".join(batch))
+            if index:
                 f.write("}\n")
-                if i == len(lines) - 1:
-                    f.write("}\n")
-                else:
-                    f.write("},\n")
+            f.write('}\n},\n"edges": {\n"_data": {\n')
+            shutil.copyfileobj(edges, f, WRITE_BUFFER_SIZE)
+            f.write('}\n}\n},\n"ponderado": true,\n"ordenado": false\n}\n')
+
+
+def text_to_snapshot(text_file, snapshot_file):
+    """
+    Converts a text file to a binary snapshot file.
+
+    Parameters
+    ----------
+    text_file : str
+        text file.
+    snapshot_file : str
+        snapshot file.
+    """
 
-            f.write("}\n")
-            f.write("}\n")
-            f.write("},\n")
+    GraphWeighted.from_txt(text_file).save_snapshot(snapshot_file)
 
-            f.write('"ponderado": true,\n')
-            f.write('"ordenado": false\n')
 
-            f.write("}\n")
+def json_to_snapshot(json_file, snapshot_file):
+    """
+    Converts a json file to a binary snapshot file.
+
+    Labels that are integers are stored as integers, like in the text files.
+
+    Parameters
+    ----------
+    json_file : str
+        json file.
+    snapshot_file : str
+        snapshot file.
+    """
+
+    json_to_graph(json_file).save_snapshot(snapshot_file)
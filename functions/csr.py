@@ -0,0 +1,269 @@
+from array import array
+from collections.abc import Mapping
+from itertools import chain
+
+
+class CSRStorage:
+    """
+    A class used to represent a graph in compressed sparse row form.
+
+    ...
+
+    Every vertex label is mapped to a dense integer id following the insertion
+    order of the adjacency list. The edges of vertex ``i`` are stored in the
+    positions ``offsets[i]`` to ``offsets[i + 1]`` of ``targets`` and ``weights``.
+
+    Attributes
+    ----------
+    labels : list
+        the vertex label of each id.
+    index : dict
+        a dictionary that maps a vertex label to its id.
+    offsets : array
+        the first edge position of each vertex, plus the total at the end.
+    targets : array
+        the id of the connected vertex of each edge.
+    weights : array
+        the weight of each edge.
+
+    Methods
+    -------
+    from_adjacency(adj)
+        Builds the storage from an adjacency list.
+
+    from_edge_list(first, second, weights)
+        Builds the storage from the columns of an edge list.
+
+    vertex_count(self)
+        Returns the number of vertices stored.
+
+    edge_count(self)
+        Returns the number of undirected edges stored.
+
+    degree(self, i)
+        Returns the degree of a vertex id.
+
+    neighbours(self, i)
+        Returns the ids connected to a vertex id.
+
+    edges(self, i)
+        Returns the (id, weight) pairs of a vertex id.
+    """
+
+    __slots__ = ("labels", "index", "offsets", "targets", "weights")
+
+    def __init__(self, labels, offsets, targets, weights):
+        """
+        Parameters
+        ----------
+        labels : list
+            the vertex label of each id.
+        offsets : sequence of int
+            the first edge position of each vertex, plus the total at the end.
+        targets : sequence of int
+            the id of the connected vertex of each edge.
+        weights : sequence of float
+            the weight of each edge.
+        """
+
+        self.labels = labels
+        self.index = {label: i for i, label in enumerate(labels)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_adjacency(cls, adj):
+        """
+        Builds the storage from an adjacency list.
+
+        Parameters
+        ----------
+        adj : dict
+            a dictionary that maps each vertex to a list of edges.
+
+        Returns
+        -------
+        the compressed storage of the adjacency list.
+        """
+
+        labels = list(adj.keys())
+        index = {label: i for i, label in enumerate(labels)}
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("d")
+        for edges in adj.values():
+            targets.extend([index[edge.connected_vertex] for edge in edges])
+            weights.extend([edge.weight for edge in edges])
+            offsets.append(len(targets))
+        return cls(labels, offsets, targets, weights)
+
+    @classmethod
+    def from_edge_list(cls, first, second, weights):
+        """
+        Builds the storage from the columns of an edge list.
+
+        The vertices and the edges of each vertex keep the order in which
+        add_edge would have inserted them.
+
+        Parameters
+        ----------
+        first : list
+            the first vertex of each edge.
+        second : list
+            the second vertex of each edge.
+        weights : list
+            the weight of each edge.
+
+        Returns
+        -------
+        the compressed storage of the edge list.
+        """
+
+        labels = list(dict.fromkeys(chain.from_iterable(zip(first, second))))
+        index = {label: i for i, label in enumerate(labels)}
+        a_ids = [index[a] for a in first]
+        b_ids = [index[b] for b in second]
+
+        degree = [0] * (len(labels) + 1)
+        for a in a_ids:
+            degree[a + 1] += 1
+        for b in b_ids:
+            degree[b + 1] += 1
+        offsets = array("q", degree)
+        for i in range(1, len(offsets)):
+            offsets[i] += offsets[i - 1]
+
+        position = offsets.tolist()
+        targets = array("q", bytes(8 * offsets[-1]))
+        edge_weights = array("d", bytes(8 * offsets[-1]))
+        for a, b, w in zip(a_ids, b_ids, weights):
+            e = position[a]
+            targets[e] = b
+            edge_weights[e] = w
+            position[a] = e + 1
+            e = position[b]
+            targets[e] = a
+            edge_weights[e] = w
+            position[b] = e + 1
+        return cls(labels, offsets, targets, edge_weights)
+
+    def vertex_count(self):
+        """
+        Returns the number of vertices stored.
+
+        Returns
+        -------
+        number of vertices.
+        """
+
+        return len(self.labels)
+
+    def edge_count(self):
+        """
+        Returns the number of undirected edges stored.
+
+        Returns
+        -------
+        number of edges.
+        """
+
+        return len(self.targets) // 2
+
+    def degree(self, i):
+        """
+        Returns the degree of a vertex id.
+
+        Parameters
+        ----------
+        i : int
+            a vertex id.
+
+        Returns
+        -------
+        degree of the vertex.
+        """
+
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def neighbours(self, i):
+        """
+        Returns the ids connected to a vertex id.
+
+        Parameters
+        ----------
+        i : int
+            a vertex id.
+
+        Returns
+        -------
+        sequence of vertex ids.
+        """
+
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def edges(self, i):
+        """
+        Returns the (id, weight) pairs of a vertex id.
+
+        Parameters
+        ----------
+        i : int
+            a vertex id.
+
+        Returns
+        -------
+        iterator of (id, weight) pairs.
+        """
+
+        start = self.offsets[i]
+        end = self.offsets[i + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+
+class CompactAdjacency(Mapping):
+    """
+    A read-only adjacency list view over a CSRStorage.
+
+    ...
+
+    Looking up a vertex builds its edge objects on demand, so code written for
+    the dictionary of lists keeps working on a compact graph.
+
+    Attributes
+    ----------
+    storage : CSRStorage
+        the compressed storage of the graph.
+    edge_class : type
+        the class used to build the edges, called as ``edge_class(v, w)``.
+    """
+
+    __slots__ = ("storage", "edge_class")
+
+    def __init__(self, storage, edge_class):
+        """
+        Parameters
+        ----------
+        storage : CSRStorage
+            the compressed storage of the graph.
+        edge_class : type
+            the class used to build the edges.
+        """
+
+        self.storage = storage
+        self.edge_class = edge_class
+
+    def __getitem__(self, v):
+        storage = self.storage
+        labels = storage.labels
+        edge_class = self.edge_class
+        return [edge_class(labels[t], w) for t, w in storage.edges(storage.index[v])]
+
+    def __contains__(self, v):
+        return v in self.storage.index
+
+    def __iter__(self):
+        return iter(self.storage.labels)
+
+    def __len__(self):
+        return len(self.storage.labels)
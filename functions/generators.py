@@ -0,0 +1,406 @@
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from functions.csr import CSRStorage
+from functions.weighted_graph import GraphWeighted
+
+# quantidade de arestas cujos pesos são sorteados e escritos de uma vez
+EDGE_BATCH_SIZE = 8192
+WEIGHTS = range(1, 101)
+# parâmetros obrigatórios de cada tipo de grafo de workload
+KINDS = {
+    "gnp": ("n", "p"),
+    "barabasi_albert": ("n", "m"),
+    "grid": ("rows", "cols"),
+    "geometric": ("n", "radius"),
+    "path": ("n",),
+    "complete": ("n",),
+}
+
+
+def gnp_edges(n, p, rng):
+    """
+    Iterates over the edges of a G(n, p) random graph using geometric skipping.
+
+    Instead of testing every pair, the gap to the next edge is drawn from a
+    geometric distribution (Batagelj and Brandes), so the cost is O(n + m).
+
+    Parameters
+    ----------
+    n : int
+        the number of vertices.
+    p : float
+        the probability of each edge.
+    rng : random.Random
+        the random number generator.
+
+    Returns
+    -------
+    iterator of (a, b) pairs with a < b.
+    """
+
+    if p <= 0:
+        return
+    if p >= 1:
+        for i in range(n):
+            for j in range(i + 1, n):
+                yield i, j
+        return
+
+    log_q = math.log(1 - p)
+    v = 1
+    w = -1
+    while v < n:
+        w += 1 + int(math.log(1 - rng.random()) / log_q)
+        while w >= v and v < n:
+            w -= v
+            v += 1
+        if v < n:
+            yield w, v
+
+
+def barabasi_albert_edges(n, m, rng):
+    """
+    Iterates over the edges of a Barabási–Albert scale-free graph.
+
+    Every new vertex connects to m distinct older vertices chosen with
+    probability proportional to their degree, using the list of edge
+    endpoints as the sampling pool.
+
+    Parameters
+    ----------
+    n : int
+        the number of vertices.
+    m : int
+        the number of edges of each new vertex.
+    rng : random.Random
+        the random number generator.
+
+    Returns
+    -------
+    iterator of (a, b) pairs.
+    """
+
+    endpoints = []
+    # os m primeiros vértices formam uma estrela para a amostragem ter por onde começar
+    for v in range(1, min(m, n)):
+        yield 0, v
+        endpoints += (0, v)
+    for v in range(m, n):
+        targets = set()
+        while len(targets) < m:
+            targets.add(rng.choice(endpoints) if endpoints else rng.randrange(v))
+        for t in targets:
+            yield t, v
+            endpoints += (t, v)
+
+
+def grid_edges(rows, cols):
+    """
+    Iterates over the edges of a two dimensional grid, vertex r * cols + c at row r and column c.
+
+    Parameters
+    ----------
+    rows : int
+        the number of rows.
+    cols : int
+        the number of columns.
+
+    Returns
+    -------
+    iterator of (a, b) pairs.
+    """
+
+    for r in range(rows):
+        for c in range(cols):
+            v = r * cols + c
+            if c + 1 < cols:
+                yield v, v + 1
+            if r + 1 < rows:
+                yield v, v + cols
+
+
+def random_geometric_edges(n, radius, rng):
+    """
+    Iterates over the edges of a random geometric graph in the unit square.
+
+    Vertices are random points and every pair closer than the radius is an
+    edge. Points are bucketed in cells of side radius, so only the
+    neighbouring cells are compared.
+
+    Parameters
+    ----------
+    n : int
+        the number of vertices.
+    radius : float
+        the connection distance.
+    rng : random.Random
+        the random number generator.
+
+    Returns
+    -------
+    iterator of (a, b) pairs with a < b.
+    """
+
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+    cells = {}
+    size = max(1, int(1 / radius)) if radius > 0 else 1
+    for v, (x, y) in enumerate(points):
+        cells.setdefault((int(x * size), int(y * size)), []).append(v)
+
+    r2 = radius * radius
+    for (cx, cy), members in cells.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                others = cells.get((cx + dx, cy + dy))
+                if not others:
+                    continue
+                for a in members:
+                    ax, ay = points[a]
+                    for b in others:
+                        if a < b and (points[b][0] - ax) ** 2 + (points[b][1] - ay) ** 2 < r2:
+                            yield a, b
+
+
+def path_edges(n):
+    """
+    Iterates over the edges of a path with n vertices.
+
+    Parameters
+    ----------
+    n : int
+        the number of vertices.
+
+    Returns
+    -------
+    iterator of (a, b) pairs.
+    """
+
+    for v in range(n - 1):
+        yield v, v + 1
+
+
+def complete_edges(n):
+    """
+    Iterates over the edges of a complete graph with n vertices.
+
+    Parameters
+    ----------
+    n : int
+        the number of vertices.
+
+    Returns
+    -------
+    iterator of (a, b) pairs with a < b.
+    """
+
+    for a in range(n):
+        for b in range(a + 1, n):
+            yield a, b
+
+
+def workload(kind, rng, **params):
+    """
+    Returns the number of vertices and the edges of a synthetic graph.
+
+    Parameters
+    ----------
+    kind : str
+        "gnp" (n, p), "barabasi_albert" (n, m), "grid" (rows, cols),
+        "geometric" (n, radius), "path" (n) or "complete" (n), see KINDS.
+    rng : random.Random
+        the random number generator.
+    params :
+        the parameters of the kind.
+
+    Returns
+    -------
+    tuple with the number of vertices and the iterator of edges.
+    """
+
+    if kind == "gnp":
+        return params["n"], gnp_edges(params["n"], params["p"], rng)
+    if kind == "barabasi_albert":
+        return params["n"], barabasi_albert_edges(params["n"], params["m"], rng)
+    if kind == "grid":
+        return params["rows"] * params["cols"], grid_edges(params["rows"], params["cols"])
+    if kind == "geometric":
+        return params["n"], random_geometric_edges(params["n"], params["radius"], rng)
+    if kind == "path":
+        return params["n"], path_edges(params["n"])
+    if kind == "complete":
+        return params["n"], complete_edges(params["n"])
+    raise ValueError(f"unknown graph kind {kind!r}")
+
+
+def generate_file(kind, path, seed=None, **params):
+    """
+    Writes a synthetic graph to a .txt file.
+
+    Parameters
+    ----------
+    kind : str
+        the kind of graph, see workload.
+    path : str
+        the .txt file.
+    seed : int or None
+        the seed of the random number generator.
+    params :
+        the parameters of the kind.
+
+    Returns
+    -------
+    the path of the file.
+    """
+
+    rng = random.Random(seed)
+    n, edges = workload(kind, rng, **params)
+    write_graph(path, n, edges, rng)
+    return path
+
+
+def generate_weighted_graph(kind, seed=None, **params):
+    """
+    Builds a synthetic graph straight into a compact GraphWeighted.
+
+    Parameters
+    ----------
+    kind : str
+        the kind of graph, see workload.
+    seed : int or None
+        the seed of the random number generator.
+    params :
+        the parameters of the kind.
+
+    Returns
+    -------
+    the graph.
+    """
+
+    rng = random.Random(seed)
+    n, edges = workload(kind, rng, **params)
+    first = []
+    second = []
+    for a, b in edges:
+        first.append(a)
+        second.append(b)
+    weights = [float(w) for w in rng.choices(WEIGHTS, k=len(first))]
+    return GraphWeighted.from_storage(n, CSRStorage.from_edge_list(first, second, weights))
+
+
+def write_graph(path, n, edges, rng):
+    """
+    Writes the edges of a graph to a .txt file with random weights from 1 to 100.
+
+    Parameters
+    ----------
+    path : str
+        the .txt file.
+    n : int
+        the number of vertices.
+    edges : iterable
+        the (a, b) pairs of the edges.
+    rng : random.Random
+        the random number generator used for the weights.
+
+    Returns
+    -------
+    the number of edges written.
+    """
+
+    m = 0
+    with open(path, "w", buffering=1 << 20) as f:
+        f.write(f"{n}\n")
+        batch = []
+        for edge in edges:
+            batch.append(edge)
+            if len(batch) == EDGE_BATCH_SIZE:
+                m += write_edge_batch(f, batch, rng)
+                batch = []
+        m += write_edge_batch(f, batch, rng)
+    return m
+
+
+def write_edge_batch(f, batch, rng):
+    """
+    Helper function for write_graph, draws the weights of a batch of edges and writes it.
+
+    Parameters
+    ----------
+    f : file
+        the .txt file.
+    batch : list
+        the (a, b) pairs of the edges.
+    rng : random.Random
+        the random number generator used for the weights.
+
+    Returns
+    -------
+    the number of edges written.
+    """
+
+    weights = rng.choices(WEIGHTS, k=len(batch))
+    f.write("".join([f"{a} {b} {w}\n" for (a, b), w in zip(batch, weights)]))
+    return len(batch)
+
+
+def generate_graph(n, p, seed=None, path=None):
+    """
+    Generates a graph with n vertices and p probability.
+
+    Parameters
+    ----------
+    n : int
+        the number of vertices.
+    p : float
+        the probability of each edge.
+    seed : int or None
+        the seed of the random number generator.
+    path : str or None
+        the .txt file, by default txt-files/graph-{n}-{p}.txt.
+
+    Returns
+    -------
+    the path of the file.
+    """
+
+    if path is None:
+        path = f"txt-files/graph-{n}-{p}.txt"
+    rng = random.Random(seed)
+    write_graph(path, n, gnp_edges(n, p, rng), rng)
+    return path
+
+
+def generate_graphs(n, p, count, seed=None, workers=None, directory="txt-files"):
+    """
+    Generates several distinct graphs with n vertices and p probability in parallel.
+
+    The i-th graph is written to {directory}/graph-{n}-{p}-{i}.txt and, when
+    a seed is given, uses seed + i so the batch is reproducible.
+
+    Parameters
+    ----------
+    n : int
+        the number of vertices.
+    p : float
+        the probability of each edge.
+    count : int
+        the number of graphs.
+    seed : int or None
+        the seed of the first graph.
+    workers : int or None
+        the number of worker processes, by default the number of CPUs.
+    directory : str
+        the directory of the files.
+
+    Returns
+    -------
+    list with the path of each file.
+    """
+
+    paths = [os.path.join(directory, f"graph-{n}-{p}-{i}.txt") for i in range(count)]
+    seeds = [None if seed is None else seed + i for i in range(count)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(generate_graph, [n] * count, [p] * count, seeds, paths))
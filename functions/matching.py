@@ -0,0 +1,264 @@
+def bipartition(storage):
+    """
+    Returns the side of every vertex id if the graph is bipartite.
+
+    Parameters
+    ----------
+    storage : CSRStorage
+        the compressed storage of the graph.
+
+    Returns
+    -------
+    list with 0 or 1 for each vertex id, or None if the graph is not bipartite.
+    """
+
+    offsets = storage.offsets
+    targets = storage.targets
+    n = storage.vertex_count()
+
+    side = [-1] * n
+    for root in range(n):
+        if side[root] != -1:
+            continue
+        side[root] = 0
+        queue = [root]
+        head = 0
+        while head < len(queue):
+            u = queue[head]
+            head += 1
+            for t in targets[offsets[u]:offsets[u + 1]]:
+                if side[t] == -1:
+                    side[t] = 1 - side[u]
+                    queue.append(t)
+                elif side[t] == side[u]:
+                    return None
+    return side
+
+
+def hopcroft_karp(storage, side):
+    """
+    Returns a maximum matching of a bipartite graph using hopcroft karp algorithm.
+
+    Parameters
+    ----------
+    storage : CSRStorage
+        the compressed storage of the graph.
+    side : list
+        the side of every vertex id, as returned by bipartition.
+
+    Returns
+    -------
+    list with the matched vertex id of each vertex id, -1 if it is not matched.
+    """
+
+    offsets = storage.offsets
+    targets = storage.targets
+    n = storage.vertex_count()
+    left = [u for u in range(n) if side[u] == 0]
+
+    mate = [-1] * n
+    while True:
+        # bfs em camadas a partir dos vértices livres da esquerda
+        dist = [-1] * n
+        queue = [u for u in left if mate[u] == -1]
+        for u in queue:
+            dist[u] = 0
+        found = False
+        head = 0
+        while head < len(queue):
+            u = queue[head]
+            head += 1
+            for t in targets[offsets[u]:offsets[u + 1]]:
+                w = mate[t]
+                if w == -1:
+                    found = True
+                elif dist[w] == -1:
+                    dist[w] = dist[u] + 1
+                    queue.append(w)
+        if not found:
+            return mate
+
+        # dfs pelas camadas procurando caminhos aumentantes disjuntos
+        position = list(offsets)
+        for root in left:
+            if mate[root] != -1:
+                continue
+            stack = [root]
+            via = []
+            while stack:
+                u = stack[-1]
+                end = offsets[u + 1]
+                advanced = False
+                while position[u] < end:
+                    t = targets[position[u]]
+                    position[u] += 1
+                    w = mate[t]
+                    if w == -1:
+                        via.append(t)
+                        for a, b in zip(stack, via):
+                            mate[a] = b
+                            mate[b] = a
+                        stack = []
+                        advanced = True
+                        break
+                    if dist[w] == dist[u] + 1:
+                        via.append(t)
+                        stack.append(w)
+                        advanced = True
+                        break
+                if not advanced:
+                    dist[u] = -1
+                    stack.pop()
+                    if via:
+                        via.pop()
+
+
+def edmonds_blossom(storage):
+    """
+    Returns a maximum matching of a general graph using edmonds blossom algorithm.
+
+    Starts from a greedy matching and then works in phases. Each phase grows
+    a forest of alternating trees from all the free vertices at once, keeping
+    the odd cycles (blossoms) in a union-find by their base, and augments
+    every time two trees meet. A tree that meets no other tree is hungarian:
+    its vertices can never be in an augmenting path again, so they are
+    removed for good. A phase visits each vertex once, and the phases stop
+    when one of them does not augment.
+
+    Parameters
+    ----------
+    storage : CSRStorage
+        the compressed storage of the graph.
+
+    Returns
+    -------
+    list with the matched vertex id of each vertex id, -1 if it is not matched.
+    """
+
+    offsets = storage.offsets
+    targets = storage.targets
+    n = storage.vertex_count()
+
+    mate = [-1] * n
+    for u in range(n):
+        if mate[u] == -1:
+            for t in targets[offsets[u]:offsets[u + 1]]:
+                if t != u and mate[t] == -1:
+                    mate[u] = t
+                    mate[t] = u
+                    break
+
+    # rótulo 1 para vértices pares da floresta e 2 para os ímpares
+    label = [0] * n
+    parent = [-1] * n
+    base = list(range(n))
+    # raiz da árvore de cada vértice rotulado
+    tree = [-1] * n
+    # estado de cada raiz na fase: 0 isolada, 1 encostou em outra árvore, 2 aumentou
+    state = [0] * n
+    # marcas com carimbo para não realocar listas a cada flor
+    mark = [0] * n
+    stamp = 0
+    # vértices de árvores húngaras, fora de todas as fases seguintes
+    removed = bytearray(n)
+
+    def find(x):
+        root = x
+        while base[root] != root:
+            root = base[root]
+        while base[x] != root:
+            base[x], x = root, base[x]
+        return root
+
+    def augment(u, v):
+        # casa u com o vértice par v e inverte o caminho de v até a raiz
+        while True:
+            last = mate[v]
+            mate[u] = v
+            mate[v] = u
+            if last == -1:
+                return
+            u = last
+            v = parent[u]
+
+    roots = [u for u in range(n) if mate[u] == -1 and offsets[u] < offsets[u + 1]]
+    while roots:
+        for root in roots:
+            label[root] = 1
+            tree[root] = root
+            state[root] = 0
+        queue = list(roots)
+        touched = list(roots)
+        augmented = False
+        head = 0
+        while head < len(queue):
+            v = queue[head]
+            head += 1
+            r = tree[v]
+            if state[r] == 2:
+                continue
+            for to in targets[offsets[v]:offsets[v + 1]]:
+                if removed[to]:
+                    continue
+                if label[to] == 0:
+                    # todo vértice livre é raiz, então este está casado
+                    parent[to] = v
+                    label[to] = 2
+                    tree[to] = r
+                    label[mate[to]] = 1
+                    tree[mate[to]] = r
+                    queue.append(mate[to])
+                    touched.append(to)
+                    touched.append(mate[to])
+                elif tree[to] != r:
+                    if label[to] == 1 and state[tree[to]] != 2:
+                        # duas árvores se encontram: aumenta pelas duas raízes
+                        state[tree[to]] = 2
+                        state[r] = 2
+                        augmented = True
+                        other = mate[to]
+                        augment(to, v)
+                        if other != -1:
+                            augment(other, parent[other])
+                        break
+                    state[r] = 1
+                elif label[to] == 1 and find(v) != find(to):
+                    # ciclo ímpar: encontra a base comum subindo pelas duas pontas
+                    stamp += 1
+                    a = find(v)
+                    b = find(to)
+                    while True:
+                        if a != -1:
+                            if mark[a] == stamp:
+                                break
+                            mark[a] = stamp
+                            a = find(parent[mate[a]]) if mate[a] != -1 else -1
+                        a, b = b, a
+                    current = a
+
+                    # contrai a flor, os ímpares dela passam a ser pares
+                    for x, child in ((v, to), (to, v)):
+                        while find(x) != current:
+                            parent[x] = child
+                            child = mate[x]
+                            if label[child] == 2:
+                                label[child] = 1
+                                queue.append(child)
+                            if base[x] == x:
+                                base[x] = current
+                            if base[child] == child:
+                                base[child] = current
+                            x = parent[child]
+
+        if not augmented:
+            return mate
+        for i in touched:
+            if state[tree[i]] == 0:
+                removed[i] = 1
+        for i in touched:
+            label[i] = 0
+            parent[i] = -1
+            base[i] = i
+            tree[i] = -1
+        roots = [u for u in roots if mate[u] == -1 and not removed[u]]
+    return mate
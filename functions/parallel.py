@@ -0,0 +1,214 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from functions.centrality import brandes_accumulate, closeness_from_distances
+
+# grafo usado pelas funções executadas dentro de cada processo do pool
+pool_graph = None
+
+
+def init_worker(graph):
+    """
+    Stores the graph that the chunks of this worker process will use.
+
+    Parameters
+    ----------
+    graph : GraphWeighted
+        the graph sent once to each worker process.
+    """
+
+    global pool_graph
+    pool_graph = graph
+
+
+def run_chunk(function, chunk):
+    """
+    Runs a chunk function against the graph of this worker process.
+
+    Parameters
+    ----------
+    function : callable
+        a module level function called as ``function(graph, chunk)``.
+    chunk : list
+        the source vertices of the chunk.
+
+    Returns
+    -------
+    the result of the function.
+    """
+
+    return function(pool_graph, chunk)
+
+
+def split_chunks(sources, workers, chunk_size=None):
+    """
+    Splits the source vertices into chunks for the workers.
+
+    Parameters
+    ----------
+    sources : list
+        the source vertices.
+    workers : int
+        the number of worker processes.
+    chunk_size : int or None
+        the number of sources per chunk, by default four chunks per worker.
+
+    Returns
+    -------
+    list of chunks.
+    """
+
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(sources) // (workers * 4)))
+    return [sources[i:i + chunk_size] for i in range(0, len(sources), chunk_size)]
+
+
+def map_source_chunks(graph, function, sources, workers=None, chunk_size=None):
+    """
+    Runs a function over chunks of source vertices, in parallel if asked.
+
+    Parameters
+    ----------
+    graph : GraphWeighted
+        the graph.
+    function : callable
+        a module level function called as ``function(graph, chunk)``.
+    sources : list
+        the source vertices.
+    workers : int or None
+        the number of worker processes, None or 1 to run in this process.
+    chunk_size : int or None
+        the number of sources per chunk.
+
+    Returns
+    -------
+    list with the result of each chunk, in the order of the sources.
+    """
+
+    if workers is None or workers <= 1:
+        return [function(graph, chunk) for chunk in split_chunks(sources, 1, chunk_size)]
+
+    chunks = split_chunks(sources, workers, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(graph.worker_copy(),)) as executor:
+        return list(executor.map(run_chunk, [function] * len(chunks), chunks))
+
+
+def eccentricity_chunk(graph, sources):
+    """
+    Returns the eccentricity of each source vertex of a chunk.
+
+    Parameters
+    ----------
+    graph : GraphWeighted
+        the graph.
+    sources : list
+        the source vertices.
+
+    Returns
+    -------
+    list of (vertex, eccentricity) pairs, the eccentricity None if there is
+    a negative cycle.
+    """
+
+    storage = graph.csr()
+    result = []
+    for v in sources:
+        # aproveita a árvore que já estiver no cache, sem guardar as novas
+        cached = graph.cache.get(v)
+        if cached is not None:
+            result.append((v, max(cached[0].values(), default=0)))
+            continue
+        distances = graph.single_source_util(storage.index[v])
+        result.append((v, None if distances is None else max(distances[0], default=0)))
+    return result
+
+
+def closeness_chunk(graph, sources, harmonic=False):
+    """
+    Returns the closeness, or harmonic centrality, of each source vertex of a chunk.
+
+    Parameters
+    ----------
+    graph : GraphWeighted
+        the graph.
+    sources : list
+        the source vertices.
+    harmonic : bool
+        whether to compute the harmonic centrality.
+
+    Returns
+    -------
+    list of (vertex, centrality) pairs, the centrality None if there is a
+    negative cycle.
+    """
+
+    storage = graph.csr()
+    n = storage.vertex_count()
+    result = []
+    for v in sources:
+        # aproveita a árvore que já estiver no cache do grafo
+        cached = graph.cache.get(v)
+        if cached is not None:
+            result.append((v, closeness_from_distances(cached[0].values(), n, harmonic)))
+            continue
+        distances = graph.single_source_util(storage.index[v])
+        result.append((v, None if distances is None else closeness_from_distances(distances[0], n, harmonic)))
+    return result
+
+
+def sample_chunk(graph, sources, harmonic=False):
+    """
+    Returns the distance sums of every vertex to the sampled source ids of a chunk.
+
+    Parameters
+    ----------
+    graph : GraphWeighted
+        the graph.
+    sources : list
+        the sampled source ids in the compressed storage.
+    harmonic : bool
+        whether to sum the inverse distances, for the harmonic centrality.
+
+    Returns
+    -------
+    tuple with the sums and the number of sources that reach each vertex id,
+    or None if there is a negative cycle.
+    """
+
+    n = graph.csr().vertex_count()
+    inf = float("inf")
+    sums = [0.0] * n
+    reached = [0] * n
+    for s in sources:
+        result = graph.single_source_util(s)
+        if result is None:
+            return None
+        for v, d in enumerate(result[0]):
+            if d != inf:
+                reached[v] += 1
+                if not harmonic:
+                    sums[v] += d
+                elif d > 0:
+                    sums[v] += 1 / d
+    return sums, reached
+
+
+def betweenness_chunk(graph, sources, weighted=True):
+    """
+    Returns the partial betweenness of every vertex id from the source ids of a chunk.
+
+    Parameters
+    ----------
+    graph : GraphWeighted
+        the graph.
+    sources : list
+        the source ids in the compressed storage.
+    weighted : bool
+        whether to use dijkstra instead of bfs.
+
+    Returns
+    -------
+    list of partial betweenness indexed by vertex id.
+    """
+
+    return brandes_accumulate(graph.csr(), sources, weighted)
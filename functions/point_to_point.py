@@ -0,0 +1,294 @@
+import heapq
+import mmap
+import struct
+import sys
+from array import array
+
+# cabeçalho: assinatura, vértices armazenados e número de marcos
+LANDMARK_HEADER = struct.Struct("<8sqq")
+LANDMARK_MAGIC = b"GRAPHLM1"
+
+
+class Landmarks:
+    """
+    A class used to represent the landmark distances of the ALT search.
+
+    ...
+
+    Attributes
+    ----------
+    ids : list
+        the vertex id of each landmark in the compressed storage.
+    distances : list
+        for each landmark, the distance to every vertex id.
+
+    Methods
+    -------
+    lower_bound(self, v, t)
+        Returns a lower bound of the distance between two vertex ids.
+    """
+
+    __slots__ = ("ids", "distances")
+
+    def __init__(self, ids, distances):
+        """
+        Parameters
+        ----------
+        ids : list
+            the vertex id of each landmark in the compressed storage.
+        distances : list
+            for each landmark, the distance to every vertex id.
+        """
+
+        self.ids = ids
+        self.distances = distances
+
+    def lower_bound(self, v, t):
+        """
+        Returns a lower bound of the distance between two vertex ids.
+
+        By the triangle inequality d(v, t) >= |d(L, t) - d(L, v)| for every
+        landmark L. Landmarks that do not reach both vertices are ignored.
+
+        Parameters
+        ----------
+        v : int
+            a vertex id.
+        t : int
+            a vertex id.
+
+        Returns
+        -------
+        the lower bound, inf if the landmarks show the vertices are not connected.
+        """
+
+        inf = float("inf")
+        bound = 0.0
+        for row in self.distances:
+            dv = row[v]
+            dt = row[t]
+            if dv == inf or dt == inf:
+                if dv != dt:
+                    return inf
+                continue
+            diff = dt - dv if dt > dv else dv - dt
+            if diff > bound:
+                bound = diff
+        return bound
+
+
+def path_from_predecessors(pred, v):
+    """
+    Returns the ids from the root of a predecessor map up to a vertex id.
+
+    Parameters
+    ----------
+    pred : dict
+        the predecessor id of each reached vertex id, -1 for the root.
+    v : int
+        a vertex id.
+
+    Returns
+    -------
+    list of vertex ids starting at the root.
+    """
+
+    path = []
+    while v != -1:
+        path.append(v)
+        v = pred[v]
+    path.reverse()
+    return path
+
+
+def bidirectional_dijkstra(storage, source, target):
+    """
+    Returns the shortest path between two vertex ids searching from both ends.
+
+    The side with the smaller heap top is advanced each step, and the search
+    stops once the two tops together are not shorter than the best meeting
+    found, so only the vertices around both ends are settled. The weights
+    must not be negative.
+
+    Parameters
+    ----------
+    storage : CSRStorage
+        the compressed storage of the graph.
+    source : int
+        the id of the first vertex.
+    target : int
+        the id of the last vertex.
+
+    Returns
+    -------
+    tuple with the distance and the list of vertex ids of the path, or inf and
+    an empty list if there is no path.
+    """
+
+    if source == target:
+        return 0.0, [source]
+
+    offsets = storage.offsets
+    targets = storage.targets
+    weights = storage.weights
+    inf = float("inf")
+
+    dist = ({source: 0.0}, {target: 0.0})
+    pred = ({source: -1}, {target: -1})
+    heaps = ([(0.0, source)], [(0.0, target)])
+    best = inf
+    meeting = None
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        heap = heaps[side]
+        mine = dist[side]
+        other = dist[1 - side]
+        du, u = heapq.heappop(heap)
+        if du > mine[u]:
+            continue
+        for e in range(offsets[u], offsets[u + 1]):
+            t = targets[e]
+            nd = du + weights[e]
+            if nd < mine.get(t, inf):
+                mine[t] = nd
+                pred[side][t] = u
+                heapq.heappush(heap, (nd, t))
+            # a aresta (u, t) liga as duas buscas
+            if t in other and nd + other[t] < best:
+                best = nd + other[t]
+                meeting = (u, t) if side == 0 else (t, u)
+
+    if meeting is None:
+        return inf, []
+    forward = path_from_predecessors(pred[0], meeting[0])
+    backward = path_from_predecessors(pred[1], meeting[1])
+    backward.reverse()
+    return best, forward + backward
+
+
+def alt_search(storage, landmarks, source, target):
+    """
+    Returns the shortest path between two vertex ids using A* with landmark bounds (ALT).
+
+    The landmark lower bound is a consistent potential, so every vertex is
+    settled once and the search stops when the target is settled. The
+    weights must not be negative.
+
+    Parameters
+    ----------
+    storage : CSRStorage
+        the compressed storage of the graph.
+    landmarks : Landmarks
+        the landmark distances of the graph.
+    source : int
+        the id of the first vertex.
+    target : int
+        the id of the last vertex.
+
+    Returns
+    -------
+    tuple with the distance and the list of vertex ids of the path, or inf and
+    an empty list if there is no path.
+    """
+
+    inf = float("inf")
+    if landmarks.lower_bound(source, target) == inf:
+        return inf, []
+
+    offsets = storage.offsets
+    targets = storage.targets
+    weights = storage.weights
+    lower_bound = landmarks.lower_bound
+
+    dist = {source: 0.0}
+    pred = {source: -1}
+    # a estimativa de cada vértice é calculada uma vez só
+    bounds = {}
+    heap = [(lower_bound(source, target), 0.0, source)]
+    while heap:
+        _, du, u = heapq.heappop(heap)
+        if du > dist[u]:
+            continue
+        if u == target:
+            return du, path_from_predecessors(pred, u)
+        for e in range(offsets[u], offsets[u + 1]):
+            t = targets[e]
+            nd = du + weights[e]
+            if nd < dist.get(t, inf):
+                dist[t] = nd
+                pred[t] = u
+                h = bounds.get(t)
+                if h is None:
+                    h = bounds[t] = lower_bound(t, target)
+                heapq.heappush(heap, (nd + h, nd, t))
+    return inf, []
+
+
+def write_landmarks(path, landmarks, n):
+    """
+    Writes the landmark distances to a binary file.
+
+    Parameters
+    ----------
+    path : str
+        the landmarks file.
+    landmarks : Landmarks
+        the landmark distances.
+    n : int
+        the number of vertices stored in the compressed storage.
+    """
+
+    sections = [array("q", landmarks.ids)] + [array("d", row) for row in landmarks.distances]
+    if sys.byteorder != "little":
+        for section in sections:
+            section.byteswap()
+    with open(path, "wb") as f:
+        f.write(LANDMARK_HEADER.pack(LANDMARK_MAGIC, n, len(landmarks.ids)))
+        for section in sections:
+            section.tofile(f)
+
+
+def read_landmarks(path, n):
+    """
+    Opens a landmarks file, memory-mapping the distances.
+
+    Parameters
+    ----------
+    path : str
+        the landmarks file.
+    n : int
+        the number of vertices stored in the compressed storage of the graph.
+
+    Returns
+    -------
+    the landmark distances.
+    """
+
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(buffer) < LANDMARK_HEADER.size:
+        raise ValueError(f"{path}: file too small to be a landmarks file")
+    magic, stored, count = LANDMARK_HEADER.unpack_from(buffer)
+    if magic != LANDMARK_MAGIC:
+        raise ValueError(f"{path}: not a landmarks file")
+    if stored != n:
+        raise ValueError(f"{path}: landmarks of a graph with {stored} vertices, not {n}")
+    if LANDMARK_HEADER.size + 8 * count * (n + 1) != len(buffer):
+        raise ValueError(f"{path}: truncated landmarks file")
+
+    view = memoryview(buffer)
+    start = LANDMARK_HEADER.size
+    sections = []
+    for code, length in [("q", count)] + [("d", n)] * count:
+        end = start + 8 * length
+        if sys.byteorder == "little":
+            sections.append(view[start:end].cast(code))
+        else:
+            section = array(code)
+            section.frombytes(view[start:end])
+            section.byteswap()
+            sections.append(section)
+        start = end
+    return Landmarks(list(sections[0]), sections[1:])
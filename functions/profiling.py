@@ -0,0 +1,146 @@
+import functools
+import time
+
+
+class GraphStats:
+    """
+    A class used to collect the counters and timings of a profiled graph.
+
+    ...
+
+    Attributes
+    ----------
+    counters : dict
+        the value of each operation counter by name.
+    calls : dict
+        the number of calls of each method by name.
+    seconds : dict
+        the total wall time of each method by name, including the methods it calls.
+
+    Methods
+    -------
+    add(self, name, amount)
+        Adds an amount to a counter.
+
+    record_call(self, name, seconds)
+        Records a call of a method.
+
+    as_dict(self)
+        Returns the counters and timings as plain dictionaries.
+
+    reset(self)
+        Zeroes every counter and timing.
+    """
+
+    __slots__ = ("counters", "calls", "seconds")
+
+    def __init__(self):
+        self.counters = {}
+        self.calls = {}
+        self.seconds = {}
+
+    def add(self, name, amount=1):
+        """
+        Adds an amount to a counter.
+
+        Parameters
+        ----------
+        name : str
+            the name of the counter.
+        amount : int
+            the amount to add.
+        """
+
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record_call(self, name, seconds):
+        """
+        Records a call of a method.
+
+        Parameters
+        ----------
+        name : str
+            the name of the method.
+        seconds : float
+            the wall time of the call.
+        """
+
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    def as_dict(self):
+        """
+        Returns the counters and timings as plain dictionaries.
+
+        Returns
+        -------
+        dictionary with the counters and, for each method, its calls and seconds.
+        """
+
+        return {
+            "counters": dict(self.counters),
+            "methods": {name: {"calls": self.calls[name], "seconds": self.seconds[name]} for name in self.calls},
+        }
+
+    def reset(self):
+        """
+        Zeroes every counter and timing.
+        """
+
+        self.counters.clear()
+        self.calls.clear()
+        self.seconds.clear()
+
+
+def profiled(stats, name, method):
+    """
+    Returns a method wrapped to record its calls and wall time.
+
+    Parameters
+    ----------
+    stats : GraphStats
+        where the calls are recorded.
+    name : str
+        the name of the method.
+    method : callable
+        the bound method.
+
+    Returns
+    -------
+    the wrapped method.
+    """
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            stats.record_call(name, time.perf_counter() - start)
+
+    return wrapper
+
+
+def format_stats(stats):
+    """
+    Returns the result of GraphWeighted.stats() as a printable table.
+
+    Parameters
+    ----------
+    stats : dict
+        the counters and timings.
+
+    Returns
+    -------
+    str with one line per method and per counter.
+    """
+
+    lines = [f"{'method':<32}{'calls':>10}{'seconds':>14}"]
+    methods = sorted(stats["methods"].items(), key=lambda item: item[1]["seconds"], reverse=True)
+    for name, method in methods:
+        lines.append(f"{name:<32}{method['calls']:>10}{method['seconds']:>14.6f}")
+    lines.append("")
+    lines.append(f"{'counter':<32}{'value':>10}")
+    for name, value in sorted(stats["counters"].items()):
+        lines.append(f"{name:<32}{value:>10}")
+    return "\n".join(lines)
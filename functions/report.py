@@ -0,0 +1,253 @@
+import glob
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from functions.weighted_graph import GraphWeighted
+
+
+def order_analysis(graph):
+    """
+    Returns the order and the size of the graph.
+    """
+
+    return {"order": graph.get_order(), "size": graph.size()}
+
+
+def degrees_analysis(graph):
+    """
+    Returns the degree of every vertex and the degree sequence.
+    """
+
+    return {
+        "degrees": {v: graph.degree_of_vertex(v) for v in graph.get_vertex_sequence()},
+        "degree_sequence": graph.degree_sequence(),
+    }
+
+
+def eccentricities_analysis(graph):
+    """
+    Returns the eccentricity of every vertex, the radius, the diameter and the center.
+    """
+
+    first = graph.get_first_vertex()
+    if first is not None and graph.shortest_distances(first) == 0:
+        return {"negative_cycle": True}
+    eccentricities = graph.all_eccentricities()
+    radius = min(eccentricities.values(), default=float("inf"))
+    return {
+        "negative_cycle": False,
+        "eccentricities": eccentricities,
+        "radius": radius,
+        "diameter": max(eccentricities.values(), default=0),
+        "center": [v for v, e in eccentricities.items() if e == radius],
+    }
+
+
+def mst_analysis(graph):
+    """
+    Returns the minimum spanning forest of the graph.
+    """
+
+    tree = graph.minimum_spanning_forest()
+    return {"weight": tree.weight, "components": tree.components, "edges": tree.edges}
+
+
+def cover_analysis(graph):
+    """
+    Returns a vertex cover of the graph found by the greedy heuristic.
+    """
+
+    cover = graph.vertex_cover()
+    return {"vertices": cover.vertices, "size": cover.size, "method": cover.method, "optimal": cover.optimal}
+
+
+def matching_analysis(graph):
+    """
+    Returns a maximum matching of the graph.
+    """
+
+    matching = graph.maximum_matching()
+    return {"edges": matching, "size": len(matching)}
+
+
+# análises disponíveis pelo nome usado na linha de comando
+ANALYSES = {
+    "order": order_analysis,
+    "degrees": degrees_analysis,
+    "eccentricities": eccentricities_analysis,
+    "mst": mst_analysis,
+    "cover": cover_analysis,
+    "matching": matching_analysis,
+}
+
+
+def json_value(value):
+    """
+    Returns a value with the infinite distances replaced by None, so the report is valid JSON.
+
+    Parameters
+    ----------
+    value :
+        a result of an analysis.
+
+    Returns
+    -------
+    the value ready for json.dump.
+    """
+
+    if isinstance(value, float) and math.isinf(value):
+        return None
+    if isinstance(value, dict):
+        return {k: json_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_value(v) for v in value]
+    return value
+
+
+def report_path(path, output_dir):
+    """
+    Returns the path of the report of a graph file.
+
+    The name is the path of the file relative to the current directory,
+    with the separators replaced by "__", so files with the same name in
+    different directories get different reports.
+
+    Parameters
+    ----------
+    path : str
+        the .txt file of the graph.
+    output_dir : str
+        the directory of the reports.
+
+    Returns
+    -------
+    the .json file.
+    """
+
+    name = os.path.relpath(path).removesuffix(".txt").replace(os.sep, "__")
+    if os.altsep:
+        name = name.replace(os.altsep, "__")
+    return os.path.join(output_dir, f"{name}.json")
+
+
+def analyse_file(path, analyses, output_dir):
+    """
+    Runs some analyses on a graph file and writes the JSON report.
+
+    A file that can not be loaded gets a report with its error, and an
+    analysis that fails records its error in place of the result, so one
+    bad input does not stop the batch.
+
+    Parameters
+    ----------
+    path : str
+        the .txt file of the graph.
+    analyses : list
+        the names of the analyses, keys of ANALYSES.
+    output_dir : str
+        the directory of the reports.
+
+    Returns
+    -------
+    tuple with the path of the report and the error message, or None. The
+    message of a failed analysis is prefixed with its name.
+    """
+
+    report = {"file": path}
+    start = time.perf_counter()
+    try:
+        graph = GraphWeighted.from_txt(path)
+    except (OSError, ValueError) as e:
+        report["error"] = str(e)
+    else:
+        report["load_seconds"] = time.perf_counter() - start
+        report["analyses"] = {}
+        for name in analyses:
+            start = time.perf_counter()
+            try:
+                result = {"result": json_value(ANALYSES[name](graph))}
+            except Exception as e:
+                result = {"error": f"{type(e).__name__}: {e}"}
+                report.setdefault("error", f"{name}: {result['error']}")
+            report["analyses"][name] = dict(result, seconds=time.perf_counter() - start)
+
+    output = report_path(path, output_dir)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=1)
+    return output, report.get("error")
+
+
+def expand_paths(patterns):
+    """
+    Returns the graph files matched by some paths or glob patterns.
+
+    Files written by minimum_spanning_tree (ending in MST.txt) are skipped,
+    they are not edge lists.
+
+    Parameters
+    ----------
+    patterns : list
+        the paths or glob patterns.
+
+    Returns
+    -------
+    sorted list of files without repetitions.
+    """
+
+    paths = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern) if glob.has_magic(pattern) else [pattern]
+        for path in matches:
+            if not path.endswith("MST.txt"):
+                paths.add(os.path.normpath(path))
+    return sorted(paths)
+
+
+def analyse_files(paths, analyses, output_dir, workers=None):
+    """
+    Runs some analyses on many graph files in parallel, one report per file.
+
+    Parameters
+    ----------
+    paths : list
+        the .txt files of the graphs.
+    analyses : list
+        the names of the analyses, keys of ANALYSES.
+    output_dir : str
+        the directory of the reports, created if needed.
+    workers : int or None
+        the number of worker processes, by default the number of CPUs, 1 to
+        run in this process.
+
+    Returns
+    -------
+    iterator of (graph file, report file, error message or None), in the
+    order of the paths.
+
+    Raises
+    ------
+    ValueError
+        if two files would write the same report.
+    """
+
+    outputs = {}
+    for path in paths:
+        output = report_path(path, output_dir)
+        if output in outputs:
+            raise ValueError(f"{outputs[output]} and {path} would both write {output}")
+        outputs[output] = path
+
+    os.makedirs(output_dir, exist_ok=True)
+    if workers == 1:
+        for path in paths:
+            yield (path,) + analyse_file(path, analyses, output_dir)
+        return
+
+    count = len(paths)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(analyse_file, paths, [analyses] * count, [output_dir] * count)
+        for path, result in zip(paths, results):
+            yield (path,) + result
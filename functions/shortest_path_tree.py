@@ -0,0 +1,117 @@
+class ShortestPathTree:
+    """
+    A class used to represent the shortest paths from one source vertex.
+
+    ...
+
+    The tree is kept as the predecessor of each vertex, so the path to a
+    target is read backwards in O(path length), without comparing distances.
+
+    Attributes
+    ----------
+    source : int
+        the source vertex.
+    distances : dict
+        the distance of each vertex from the source, inf if unreachable.
+    predecessors : dict
+        the previous vertex of each path, None for the source and the
+        unreachable vertices.
+
+    Methods
+    -------
+    distance(self, target)
+        Returns the distance from the source to a vertex.
+
+    has_path(self, target)
+        Returns if there is a path from the source to a vertex.
+
+    path_to(self, target)
+        Returns the shortest path from the source to a vertex.
+
+    edges(self)
+        Returns the edges of the tree.
+    """
+
+    __slots__ = ("source", "distances", "predecessors")
+
+    def __init__(self, source, distances, predecessors):
+        """
+        Parameters
+        ----------
+        source : int
+            the source vertex.
+        distances : dict
+            the distance of each vertex from the source.
+        predecessors : dict
+            the previous vertex of each path.
+        """
+
+        self.source = source
+        self.distances = distances
+        self.predecessors = predecessors
+
+    def distance(self, target):
+        """
+        Returns the distance from the source to a vertex.
+
+        Parameters
+        ----------
+        target : int
+            a vertex.
+
+        Returns
+        -------
+        the distance, inf if there is no path.
+        """
+
+        return self.distances[target]
+
+    def has_path(self, target):
+        """
+        Returns if there is a path from the source to a vertex.
+
+        Parameters
+        ----------
+        target : int
+            a vertex.
+
+        Returns
+        -------
+        True if the vertex is reachable, False otherwise.
+        """
+
+        return target == self.source or self.predecessors[target] is not None
+
+    def path_to(self, target):
+        """
+        Returns the shortest path from the source to a vertex.
+
+        Parameters
+        ----------
+        target : int
+            a vertex.
+
+        Returns
+        -------
+        list of vertices from the source to the target, empty if there is no path.
+        """
+
+        if not self.has_path(target):
+            return []
+        predecessors = self.predecessors
+        path = [target]
+        while path[-1] != self.source:
+            path.append(predecessors[path[-1]])
+        path.reverse()
+        return path
+
+    def edges(self):
+        """
+        Returns the edges of the tree.
+
+        Returns
+        -------
+        list of (predecessor, vertex, distance of the vertex) tuples.
+        """
+
+        return [(p, v, self.distances[v]) for v, p in self.predecessors.items() if p is not None]
@@ -0,0 +1,174 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+from functions.csr import CSRStorage
+
+# cabeçalho: assinatura, número de vértices do arquivo, vértices armazenados,
+# posições de arestas, tipo dos rótulos, tamanho dos rótulos em bytes e se
+# algum peso é negativo
+HEADER = struct.Struct("<8sqqqqqq")
+MAGIC = b"GRAPHSN1"
+
+LABELS_INT = 0
+LABELS_JSON = 1
+
+
+class MappedCSRStorage(CSRStorage):
+    """
+    A CSRStorage whose arrays are memory-mapped from a snapshot file.
+
+    ...
+
+    The offsets, targets and weights are read-only views over the mapped file,
+    so opening a snapshot does not copy the edges and every process that
+    opens the same file shares its pages. Pickling a mapped storage sends
+    only the path, and the receiving process maps the file again.
+
+    Attributes
+    ----------
+    path : str
+        the snapshot file.
+    buffer : mmap.mmap
+        the mapped file.
+    """
+
+    __slots__ = ("path", "buffer")
+
+    def __reduce__(self):
+        return open_snapshot_storage, (self.path,)
+
+
+def write_snapshot(path, v_number, storage, has_negative_weight):
+    """
+    Writes a compressed storage to a binary snapshot file.
+
+    Parameters
+    ----------
+    path : str
+        the snapshot file.
+    v_number : int
+        the number of vertices of the graph.
+    storage : CSRStorage
+        the compressed storage of the graph.
+    has_negative_weight : bool
+        whether some weight is negative.
+    """
+
+    if all(type(label) is int for label in storage.labels):
+        label_kind = LABELS_INT
+        labels = array("q", storage.labels)
+    else:
+        label_kind = LABELS_JSON
+        labels = json.dumps(storage.labels).encode()
+
+    sections = [array("q", storage.offsets), array("q", storage.targets), array("d", storage.weights)]
+    if label_kind == LABELS_INT:
+        sections.append(labels)
+    if sys.byteorder != "little":
+        for section in sections:
+            section.byteswap()
+    label_bytes = len(labels) * 8 if label_kind == LABELS_INT else len(labels)
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, v_number, storage.vertex_count(), len(storage.targets), label_kind, label_bytes,
+                            int(has_negative_weight)))
+        for section in sections:
+            section.tofile(f)
+        if label_kind == LABELS_JSON:
+            f.write(labels)
+
+
+def read_snapshot_header(buffer, path):
+    """
+    Helper function for open_snapshot.
+
+    Parameters
+    ----------
+    buffer : mmap.mmap
+        the mapped file.
+    path : str
+        the snapshot file, used in the error messages.
+
+    Returns
+    -------
+    tuple with the number of vertices of the graph, the number of vertices
+    stored, the number of edge positions, the type of the labels, the size of
+    the labels in bytes and whether some weight is negative.
+    """
+
+    if len(buffer) < HEADER.size:
+        raise ValueError(f"{path}: file too small to be a graph snapshot")
+    magic, v_number, n, entries, label_kind, label_bytes, has_negative_weight = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a graph snapshot")
+    if HEADER.size + 8 * (n + 1 + 2 * entries) + label_bytes != len(buffer):
+        raise ValueError(f"{path}: truncated graph snapshot")
+    return v_number, n, entries, label_kind, label_bytes, bool(has_negative_weight)
+
+
+def open_snapshot(path):
+    """
+    Opens a binary snapshot file without copying its edges.
+
+    Parameters
+    ----------
+    path : str
+        the snapshot file.
+
+    Returns
+    -------
+    tuple with the number of vertices of the graph, its compressed storage
+    and whether some weight is negative.
+    """
+
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    v_number, n, entries, label_kind, label_bytes, has_negative_weight = read_snapshot_header(buffer, path)
+
+    view = memoryview(buffer)
+    start = HEADER.size
+    sections = []
+    for code, length in (("q", n + 1), ("q", entries), ("d", entries)):
+        end = start + 8 * length
+        if sys.byteorder == "little":
+            sections.append(view[start:end].cast(code))
+        else:
+            section = array(code)
+            section.frombytes(view[start:end])
+            section.byteswap()
+            sections.append(section)
+        start = end
+
+    if label_kind == LABELS_INT:
+        labels = array("q")
+        labels.frombytes(view[start:start + label_bytes])
+        if sys.byteorder != "little":
+            labels.byteswap()
+        labels = labels.tolist()
+    else:
+        labels = json.loads(bytes(view[start:start + label_bytes]))
+
+    storage = MappedCSRStorage(labels, *sections)
+    storage.path = path
+    storage.buffer = buffer
+    return v_number, storage, has_negative_weight
+
+
+def open_snapshot_storage(path):
+    """
+    Opens only the compressed storage of a binary snapshot file.
+
+    Parameters
+    ----------
+    path : str
+        the snapshot file.
+
+    Returns
+    -------
+    the compressed storage.
+    """
+
+    return open_snapshot(path)[1]
@@ -0,0 +1,115 @@
+from functions.union_find import DisjointSet
+
+
+class SpanningTree:
+    """
+    A class used to represent a minimum spanning tree, or forest.
+
+    ...
+
+    Attributes
+    ----------
+    edges : list
+        the (a, b, weight) tuples of the tree edges.
+    weight : float
+        the total weight of the tree.
+    components : int
+        the number of trees, 1 if the graph is connected.
+
+    Methods
+    -------
+    is_tree(self)
+        Returns if the graph is connected and the result is a single tree.
+
+    write(self, s, v_number)
+        Writes the tree to a txt file.
+    """
+
+    __slots__ = ("edges", "weight", "components")
+
+    def __init__(self, edges, weight, components):
+        """
+        Parameters
+        ----------
+        edges : list
+            the (a, b, weight) tuples of the tree edges.
+        weight : float
+            the total weight of the tree.
+        components : int
+            the number of trees.
+        """
+
+        self.edges = edges
+        self.weight = weight
+        self.components = components
+
+    def is_tree(self):
+        """
+        Returns if the graph is connected and the result is a single tree.
+
+        Returns
+        -------
+        True if it is a spanning tree, False if it is a forest.
+        """
+
+        return self.components <= 1
+
+    def write(self, s, v_number):
+        """
+        Writes the tree to a txt file.
+
+        The first line has the number of vertices, the second the total weight
+        and each other line an edge.
+
+        Parameters
+        ----------
+        s : str
+            the name of the file.
+        v_number : int
+            the number of vertices of the graph.
+        """
+
+        with open(s, "w", buffering=1 << 20) as f:
+            f.write(f"{v_number}\n{self.weight}\n")
+            for i in range(0, len(self.edges), 4096):
+                f.write("".join([f"{a} {b} {w}\n" for a, b, w in self.edges[i:i + 4096]]))
+
+
+def kruskal(storage):
+    """
+    Returns the minimum spanning forest of a compressed storage using kruskal algorithm.
+
+    Parameters
+    ----------
+    storage : CSRStorage
+        the compressed storage of the graph.
+
+    Returns
+    -------
+    the SpanningTree of the graph.
+    """
+
+    offsets = storage.offsets
+    targets = storage.targets
+    weights = storage.weights
+    labels = storage.labels
+    n = storage.vertex_count()
+
+    # cada aresta aparece nas duas direções, fica só a do vértice de menor id
+    candidates = []
+    for u in range(n):
+        for e in range(offsets[u], offsets[u + 1]):
+            if u < targets[e]:
+                candidates.append((weights[e], u, targets[e]))
+    candidates.sort()
+
+    sets = DisjointSet(n)
+    edges = []
+    total = 0
+    for w, u, t in candidates:
+        if sets.union(u, t):
+            edges.append((labels[u], labels[t], w))
+            total += w
+            if len(edges) == n - 1:
+                break
+    return SpanningTree(edges, total, sets.count)
@@ -0,0 +1,126 @@
+class DisjointSet:
+    """
+    A class used to represent a disjoint-set forest (union-find).
+
+    ...
+
+    Uses union by size and path halving, so every operation runs in almost
+    constant amortized time.
+
+    Attributes
+    ----------
+    parent : list
+        the parent of each element, an element is a root if it is its own parent.
+    set_size : list
+        the number of elements of the set of each root.
+    count : int
+        the number of disjoint sets.
+
+    Methods
+    -------
+    add(self)
+        Adds a new element in its own set.
+
+    find(self, x)
+        Returns the root of the set of an element.
+
+    union(self, x, y)
+        Joins the sets of two elements.
+
+    connected(self, x, y)
+        Returns if two elements are in the same set.
+    """
+
+    __slots__ = ("parent", "set_size", "count")
+
+    def __init__(self, n=0):
+        """
+        Parameters
+        ----------
+        n : int
+            the number of elements, each one in its own set.
+        """
+
+        self.parent = list(range(n))
+        self.set_size = [1] * n
+        self.count = n
+
+    def add(self):
+        """
+        Adds a new element in its own set.
+
+        Returns
+        -------
+        the new element.
+        """
+
+        x = len(self.parent)
+        self.parent.append(x)
+        self.set_size.append(1)
+        self.count += 1
+        return x
+
+    def find(self, x):
+        """
+        Returns the root of the set of an element.
+
+        Parameters
+        ----------
+        x : int
+            an element.
+
+        Returns
+        -------
+        the root of the set.
+        """
+
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        """
+        Joins the sets of two elements.
+
+        Parameters
+        ----------
+        x : int
+            an element.
+        y : int
+            an element.
+
+        Returns
+        -------
+        True if the sets were joined, False if the elements were already in the same set.
+        """
+
+        x = self.find(x)
+        y = self.find(y)
+        if x == y:
+            return False
+        if self.set_size[x] < self.set_size[y]:
+            x, y = y, x
+        self.parent[y] = x
+        self.set_size[x] += self.set_size[y]
+        self.count -= 1
+        return True
+
+    def connected(self, x, y):
+        """
+        Returns if two elements are in the same set.
+
+        Parameters
+        ----------
+        x : int
+            an element.
+        y : int
+            an element.
+
+        Returns
+        -------
+        True if the elements are in the same set, False otherwise.
+        """
+
+        return self.find(x) == self.find(y)
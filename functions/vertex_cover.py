@@ -0,0 +1,432 @@
+import itertools
+import time
+
+
+class VertexCover:
+    """
+    A class used to represent a vertex cover.
+
+    ...
+
+    Attributes
+    ----------
+    vertices : list
+        the vertices of the cover.
+    size : int
+        the number of vertices of the cover.
+    method : str
+        the algorithm that found the cover.
+    optimal : bool
+        True if the cover is known to be minimum.
+    """
+
+    __slots__ = ("vertices", "size", "method", "optimal")
+
+    def __init__(self, vertices, method, optimal=False):
+        """
+        Parameters
+        ----------
+        vertices : list
+            the vertices of the cover.
+        method : str
+            the algorithm that found the cover.
+        optimal : bool
+            True if the cover is known to be minimum.
+        """
+
+        self.vertices = vertices
+        self.size = len(vertices)
+        self.method = method
+        self.optimal = optimal
+
+
+def greedy_cover(storage):
+    """
+    Returns the ids of a vertex cover picking the vertex of maximum residual degree each time.
+
+    The residual degree of a vertex counts its edges not covered yet. The
+    vertices are kept in buckets by residual degree, and a decrement just
+    pushes the vertex into the bucket below, leaving the old entry to be
+    skipped when it is popped. The whole cover costs O(V + E).
+
+    Parameters
+    ----------
+    storage : CSRStorage
+        the compressed storage of the graph.
+
+    Returns
+    -------
+    list of vertex ids in the order they were picked.
+    """
+
+    offsets = storage.offsets
+    targets = storage.targets
+    n = storage.vertex_count()
+
+    degree = [offsets[u + 1] - offsets[u] for u in range(n)]
+    buckets = [[] for _ in range(max(degree, default=0) + 1)]
+    # inserido ao contrário para que empates saiam na ordem dos vértices
+    for u in range(n - 1, -1, -1):
+        buckets[degree[u]].append(u)
+
+    covered = bytearray(n)
+    cover = []
+    top = len(buckets) - 1
+    while top > 0:
+        bucket = buckets[top]
+        if not bucket:
+            top -= 1
+            continue
+        u = bucket.pop()
+        if covered[u] or degree[u] != top:
+            continue
+        covered[u] = 1
+        cover.append(u)
+        for t in targets[offsets[u]:offsets[u + 1]]:
+            if not covered[t]:
+                degree[t] -= 1
+                buckets[degree[t]].append(t)
+    return cover
+
+
+def matching_cover(storage):
+    """
+    Returns the ids of a vertex cover made of both ends of a maximal matching.
+
+    The cover is at most twice the size of a minimum vertex cover.
+
+    Parameters
+    ----------
+    storage : CSRStorage
+        the compressed storage of the graph.
+
+    Returns
+    -------
+    list of vertex ids.
+    """
+
+    offsets = storage.offsets
+    targets = storage.targets
+
+    covered = bytearray(storage.vertex_count())
+    cover = []
+    for u in range(storage.vertex_count()):
+        if covered[u]:
+            continue
+        for t in targets[offsets[u]:offsets[u + 1]]:
+            if not covered[t]:
+                covered[u] = 1
+                cover.append(u)
+                if t != u:
+                    covered[t] = 1
+                    cover.append(t)
+                break
+    return cover
+
+
+def simple_adjacency(storage):
+    """
+    Returns the adjacency sets of a compressed storage, without repeated edges and loops.
+
+    Parameters
+    ----------
+    storage : CSRStorage
+        the compressed storage of the graph.
+
+    Returns
+    -------
+    tuple with the dictionary of neighbour sets by vertex id and the list of
+    vertex ids that have a loop, which must be in every cover.
+    """
+
+    offsets = storage.offsets
+    targets = storage.targets
+    adj = {}
+    loops = []
+    for u in range(storage.vertex_count()):
+        neighbours = set(targets[offsets[u]:offsets[u + 1]])
+        if u in neighbours:
+            neighbours.discard(u)
+            loops.append(u)
+        adj[u] = neighbours
+    return adj, loops
+
+
+def take_vertex(adj, v, cover):
+    """
+    Puts a vertex in the cover and removes it from the adjacency sets.
+
+    Parameters
+    ----------
+    adj : dict
+        the neighbour sets by vertex id.
+    v : int
+        a vertex id.
+    cover : list
+        the partial cover.
+    """
+
+    cover.append(v)
+    remove_vertex(adj, v)
+
+
+def remove_vertex(adj, v):
+    """
+    Removes a vertex from the adjacency sets.
+
+    Parameters
+    ----------
+    adj : dict
+        the neighbour sets by vertex id.
+    v : int
+        a vertex id.
+    """
+
+    for u in adj.pop(v):
+        adj[u].discard(v)
+
+
+def find_crown(adj):
+    """
+    Returns a crown of the graph, if one is found.
+
+    A crown is an independent set I with H = N(I) matched into I. Some
+    minimum cover contains H and nothing of I. The search starts from the
+    vertices left out of a maximal matching and follows a maximum matching
+    between them and their neighbours.
+
+    Parameters
+    ----------
+    adj : dict
+        the neighbour sets by vertex id.
+
+    Returns
+    -------
+    tuple with the head H and the crown I, or None.
+    """
+
+    matched = set()
+    for v in adj:
+        if v in matched:
+            continue
+        for u in adj[v]:
+            if u not in matched:
+                matched.add(u)
+                matched.add(v)
+                break
+    outsiders = [v for v in adj if v not in matched]
+    if not outsiders:
+        return None
+
+    # emparelhamento máximo entre os vértices de fora e seus vizinhos
+    mate = {}
+    for root in outsiders:
+        seen = set()
+        stack = [(root, iter(adj[root]))]
+        path = []
+        while stack:
+            o, it = stack[-1]
+            for h in it:
+                if h in seen:
+                    continue
+                seen.add(h)
+                if h not in mate:
+                    path.append(h)
+                    for (a, _), b in zip(stack, path):
+                        mate[a] = b
+                        mate[b] = a
+                    stack = []
+                    break
+                path.append(h)
+                stack.append((mate[h], iter(adj[mate[h]])))
+                break
+            else:
+                stack.pop()
+                if path:
+                    path.pop()
+
+    crown = {v for v in outsiders if v not in mate}
+    if not crown:
+        return None
+    while True:
+        head = set()
+        for v in crown:
+            head |= adj[v]
+        grown = crown | {mate[h] for h in head}
+        if grown == crown:
+            return head, crown
+        crown = grown
+
+
+def reduce_cover(adj, cover, folds, new_ids):
+    """
+    Applies the degree 0, 1, 2 and crown reductions until none applies.
+
+    Parameters
+    ----------
+    adj : dict
+        the neighbour sets by vertex id, changed in place.
+    cover : list
+        the partial cover, changed in place.
+    folds : list
+        the (x, v, u, w) degree 2 folds, where x replaced v, u and w.
+    new_ids : iterator
+        source of ids for the folded vertices.
+    """
+
+    while True:
+        changed = False
+        for v in list(adj):
+            if v not in adj:
+                continue
+            d = len(adj[v])
+            if d == 0:
+                del adj[v]
+            elif d == 1:
+                take_vertex(adj, next(iter(adj[v])), cover)
+            elif d == 2:
+                u, w = adj[v]
+                if w in adj[u]:
+                    take_vertex(adj, u, cover)
+                    take_vertex(adj, w, cover)
+                else:
+                    # dobra: v, u e w viram um só vértice x ligado a N(u) ∪ N(w)
+                    neighbours = (adj[u] | adj[w]) - {v}
+                    remove_vertex(adj, v)
+                    remove_vertex(adj, u)
+                    remove_vertex(adj, w)
+                    x = next(new_ids)
+                    adj[x] = neighbours
+                    for y in neighbours:
+                        adj[y].add(x)
+                    folds.append((x, v, u, w))
+            else:
+                continue
+            changed = True
+        if changed:
+            continue
+
+        crown = find_crown(adj)
+        if crown is None:
+            return
+        head, independent = crown
+        for h in head:
+            take_vertex(adj, h, cover)
+        for v in independent:
+            if v in adj:
+                remove_vertex(adj, v)
+
+
+def unfold_cover(cover, folds):
+    """
+    Returns the cover of the original graph from a cover of the folded graph.
+
+    Parameters
+    ----------
+    cover : list
+        the cover of the folded graph.
+    folds : list
+        the (x, v, u, w) degree 2 folds in the order they were made.
+
+    Returns
+    -------
+    set of vertex ids.
+    """
+
+    cover = set(cover)
+    for x, v, u, w in reversed(folds):
+        if x in cover:
+            cover.discard(x)
+            cover.add(u)
+            cover.add(w)
+        else:
+            cover.add(v)
+    return cover
+
+
+def matching_lower_bound(adj):
+    """
+    Returns the size of a maximal matching, a lower bound for any vertex cover.
+
+    Parameters
+    ----------
+    adj : dict
+        the neighbour sets by vertex id.
+
+    Returns
+    -------
+    number of matched edges.
+    """
+
+    matched = set()
+    size = 0
+    for v in adj:
+        if v in matched:
+            continue
+        for u in adj[v]:
+            if u not in matched:
+                matched.add(u)
+                matched.add(v)
+                size += 1
+                break
+    return size
+
+
+def exact_cover(storage, time_limit=None):
+    """
+    Returns the ids of a minimum vertex cover using kernelization and branch and bound.
+
+    Every node of the search applies the reductions, prunes with the maximal
+    matching lower bound and branches on a vertex of maximum degree: either
+    the vertex or all its neighbours go to the cover.
+
+    Parameters
+    ----------
+    storage : CSRStorage
+        the compressed storage of the graph.
+    time_limit : float or None
+        the maximum number of seconds of search, None for no limit.
+
+    Returns
+    -------
+    tuple with the list of vertex ids of the best cover found and True if
+    the search finished, so the cover is minimum.
+    """
+
+    deadline = None if time_limit is None else time.monotonic() + time_limit
+    adj, loops = simple_adjacency(storage)
+    cover = []
+    for v in loops:
+        take_vertex(adj, v, cover)
+    new_ids = itertools.count(storage.vertex_count())
+
+    best = greedy_cover(storage)
+    finished = True
+    stack = [(adj, cover, [])]
+    while stack:
+        if deadline is not None and time.monotonic() > deadline:
+            finished = False
+            break
+        adj, cover, folds = stack.pop()
+        reduce_cover(adj, cover, folds, new_ids)
+        if not adj:
+            solution = unfold_cover(cover, folds)
+            if len(solution) < len(best):
+                best = list(solution)
+            continue
+        # cada dobra já conta um vértice a mais na cobertura final
+        if len(cover) + len(folds) + matching_lower_bound(adj) >= len(best):
+            continue
+
+        v = max(adj, key=lambda x: len(adj[x]))
+        neighbours = list(adj[v])
+
+        with_neighbours = {u: set(s) for u, s in adj.items()}
+        cover_neighbours = list(cover)
+        for u in neighbours:
+            take_vertex(with_neighbours, u, cover_neighbours)
+        stack.append((with_neighbours, cover_neighbours, list(folds)))
+
+        take_vertex(adj, v, cover)
+        stack.append((adj, cover, folds))
+    return best, finished
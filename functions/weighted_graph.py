@@ -1,3 +1,58 @@
+import functools
+import heapq
+import os
+import random
+import re
+from array import array
+from collections import OrderedDict
+
+from functions.centrality import closeness_from_distances, sample_size, sampled_closeness
+from functions.csr import CSRStorage, CompactAdjacency
+from functions.matching import bipartition, edmonds_blossom, hopcroft_karp
+from functions.parallel import betweenness_chunk, closeness_chunk, eccentricity_chunk, map_source_chunks, sample_chunk
+from functions.point_to_point import Landmarks, alt_search, bidirectional_dijkstra, read_landmarks, write_landmarks
+from functions.profiling import GraphStats, profiled
+from functions.shortest_path_tree import ShortestPathTree
+from functions.snapshot import open_snapshot, write_snapshot
+from functions.spanning_tree import kruskal
+from functions.union_find import DisjointSet
+from functions.vertex_cover import VertexCover, exact_cover, greedy_cover, matching_cover
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# limites para usar a matriz de distâncias em vez de uma busca por vértice
+DENSE_MAX_VERTICES = 4096
+DENSE_MIN_DENSITY = 0.1
+
+# fontes mantidas no cache de distâncias por padrão, cada uma guarda dois
+# dicionários com todos os vértices
+DISTANCE_CACHE_SIZE = 8
+
+# quantidade de caracteres lidos por vez pelo from_txt
+READ_CHUNK_SIZE = 1 << 22
+
+# encontra a primeira linha não vazia que não tem exatamente 3 colunas
+BAD_EDGE_LINE = re.compile(r"^(?![ \t\r\f\v]*$)(?![ \t\r\f\v]*\S+[ \t\r\f\v]+\S+[ \t\r\f\v]+\S+[ \t\r\f\v]*$)", re.M)
+
+# os marcos do ALT ficam em um arquivo ao lado do snapshot, com este sufixo
+LANDMARKS_SUFFIX = ".landmarks"
+
+# métodos cujas chamadas e tempos são registrados com o perfilamento ligado
+PROFILED_METHODS = (
+    "csr", "get_order", "size", "get_neighbours", "degree_of_vertex", "degree_sequence",
+    "eccentricity", "bellman_ford", "bellman_ford_util", "dijkstra", "dijkstra_util",
+    "single_source", "shortest_distances", "shortest_path_tree", "update_distances", "distance_matrix", "all_eccentricities",
+    "radius", "diameter", "center", "dfs", "bfs", "component_ids", "connected_components",
+    "dfs_not_visited", "minimum_path", "shortest_path", "prepare_landmarks", "closeness_centrality",
+    "harmonic_centrality", "all_closeness", "betweenness_centrality", "single_source_util", "has_cycle", "find_cycle_edge",
+    "minimum_vertex_cover_heuristic", "vertex_cover", "minimum_spanning_tree",
+    "minimum_spanning_forest", "maximum_matching", "is_bipartite",
+)
+
+
 class Edge:
     """
     A class used to represent an edge.
@@ -17,6 +72,8 @@ class Edge:
         Returns a string representation of the edge.
     """
 
+    __slots__ = ("connected_vertex", "weight")
+
     def __init__(self, v, w):
         """
         Parameters
@@ -49,10 +106,64 @@ class GraphWeighted:
     v_number : int
         an integer that represents the number of vertices.
     adj :
-        a dictionary that represents the adjacency list of the graph.
+        a dictionary that represents the adjacency list of the graph, or a
+        read-only view over the compressed storage when the graph is compact.
+    storage : CSRStorage or None
+        the compressed sparse row storage of the graph. It is built on demand
+        for the algorithms and dropped when an edge is added.
+    has_negative_weight : bool
+        True if an edge with negative weight was added to the graph.
+    cache_size : int or None
+        the maximum number of sources kept in the distance cache, None for no
+        limit and 0 to disable it. DISTANCE_CACHE_SIZE by default. The sources
+        given to track_distances() do not count.
+    cache : OrderedDict
+        the single source results by source vertex, least recently used first.
+    matrix : numpy.ndarray or None
+        the all pairs distance matrix, kept until an edge is added.
+    components : DisjointSet or None
+        the disjoint-set forest of the vertices, when cycle tracking is enabled.
+    component_index : dict
+        a dictionary that maps a vertex to its element in the disjoint-set forest.
+    cycle_edge : tuple or None
+        the first edge added that closed a cycle, when cycle tracking is enabled.
+    profile : GraphStats or None
+        the counters and timings of the graph, when profiling is enabled.
+    dynamic : bool
+        True if add_edge updates the tracked distance trees instead of
+        dropping them, see track_distances().
+    tracked_sources : set or None
+        the sources whose distance trees are updated by add_edge, None for
+        every cached source.
+    landmarks : Landmarks or None
+        the landmark distances used by shortest_path, kept until an edge is added.
 
     Methods
     -------
+    from_txt(path, compact=True)
+        Loads a graph from a .txt edge list file.
+
+    parse_edge_lines(lines, first_line, path)
+        Helper function for from_txt.
+
+    from_storage(v_number, storage, compact=True)
+        Builds a graph from a compressed storage.
+
+    from_snapshot(path)
+        Opens a graph from a binary snapshot file.
+
+    save_snapshot(self, path)
+        Saves the graph to a binary snapshot file.
+
+    compact(self)
+        Replaces the adjacency list with the compressed storage.
+
+    is_compact(self)
+        Returns if the graph is using the compressed storage.
+
+    csr(self)
+        Returns the compressed sparse row storage of the graph.
+
     get_vertex_sequence(self)
         Returns a sequence of vertex.
 
@@ -62,6 +173,9 @@ class GraphWeighted:
     add_edge(self, a, b, w)
         Adds a new edge to the graph.
 
+    track_edge(self, a, b, w)
+        Helper function for add_edge, joins the vertices of a new edge in the disjoint-set forest.
+
     get_order(self)
         Returns the order of the graph.
 
@@ -83,41 +197,394 @@ class GraphWeighted:
     bellman_ford(self, vertex)
         Returns the distances of all vertices from a vertex using bellman ford algorithm.
 
-    radius(self)
+    dijkstra(self, vertex)
+        Returns the distances of all vertices from a vertex using dijkstra algorithm.
+
+    bellman_ford_util(self, source)
+        Helper function for bellman_ford.
+
+    dijkstra_util(self, source)
+        Helper function for dijkstra.
+
+    single_source(self, vertex)
+        Returns the distances and predecessors of all vertices from a vertex.
+
+    single_source_util(self, source)
+        Helper function for single_source, without the cache.
+
+    shortest_distances(self, vertex)
+        Returns the distances of all vertices from a vertex using the fastest valid algorithm.
+
+    shortest_path_tree(self, source)
+        Returns the shortest paths from a vertex to all vertices.
+
+    clear_cache(self)
+        Removes every result from the distance cache.
+
+    track_distances(self, *vertices)
+        Starts updating the distance trees of some sources on add_edge instead of dropping them.
+
+    is_tracked(self, vertex)
+        Returns if the distance tree of a source is updated by add_edge.
+
+    update_distances(self, a, b, w)
+        Helper function for add_edge, propagates the improvements of a new edge through the tracked trees.
+
+    distance_matrix(self)
+        Returns the distances between all pairs of vertices using floyd warshall algorithm.
+
+    use_distance_matrix(self)
+        Returns if the all pairs queries should use the distance matrix.
+
+    all_eccentricities(self, workers=None, chunk_size=None)
+        Returns the eccentricity of every vertex.
+
+    worker_copy(self)
+        Returns a compact copy of the graph without cache, to be sent to worker processes.
+
+    radius(self, workers=None)
         Returns the radius of the graph.
 
-    diameter(self)
+    diameter(self, workers=None)
         Returns the diameter of the graph.
 
-    center(self)
+    center(self, workers=None)
         Returns the center of the graph.
 
     dfs(self, v)
         Returns the dfs of the graph.
 
-    dfs_util(self, v, visited)
+    dfs_util(self, source, visited, sequence)
         Helper function for dfs.
 
+    bfs(self, v)
+        Returns the bfs of the graph.
+
+    bfs_util(self, source, visited, sequence)
+        Helper function for bfs.
+
+    component_ids(self)
+        Returns the connected component of every vertex id.
+
+    connected_components(self)
+        Returns the connected components of the graph.
+
     dfs_not_visited(self)
         Returns vertices that were not visited by the dfs.
 
     closeness_centrality(self, v)
         Returns the closeness centrality of a vertex.
 
+    harmonic_centrality(self, v)
+        Returns the harmonic centrality of a vertex.
+
+    vertex_centrality(self, v, harmonic)
+        Helper function for closeness_centrality and harmonic_centrality.
+
+    all_closeness(self, harmonic=False, epsilon=None, seed=None, workers=None, chunk_size=None)
+        Returns the closeness, or harmonic, centrality of every vertex.
+
+    betweenness_centrality(self, normalized=True, k=None, seed=None, weighted=None, workers=None, chunk_size=None)
+        Returns the betweenness centrality of every vertex.
+
     minimum_path(self, v, w)
         Returns the minimum path between two vertices.
+
+    shortest_path(self, a, b, method=None)
+        Returns the distance and the shortest path between two vertices.
+
+    prepare_landmarks(self, count=8)
+        Computes the landmark distances used by shortest_path.
+
+    save_landmarks(self, path)
+        Saves the landmark distances to a binary file.
+
+    load_landmarks(self, path)
+        Opens the landmark distances from a binary file.
+
+    minimum_vertex_cover_heuristic(self)
+        Returns the minimum vertex cover of the graph using a heuristic.
+
+    vertex_cover(self, method="greedy", time_limit=None)
+        Returns a vertex cover of the graph.
+
+    minimum_spanning_tree(self, s)
+        Returns the minimum spanning tree of the graph and writes it to a txt file.
+
+    minimum_spanning_forest(self)
+        Returns the minimum spanning forest of the graph.
+
+    has_cycle(self)
+        Returns if the graph has a cycle.
+
+    find_cycle_edge(self)
+        Returns an edge that closes a cycle.
+
+    track_cycles(self)
+        Starts keeping a disjoint-set forest of the vertices updated by add_edge.
+
+    component_count(self)
+        Returns the number of connected components of the graph.
+
+    maximum_matching(self)
+        Returns the maximum matching of the graph.
+
+    is_bipartite(self)
+        Returns if the graph is bipartite.
+
+    enable_profiling(self)
+        Starts counting the hot path operations and timing the methods.
+
+    disable_profiling(self)
+        Stops the profiling and drops the collected statistics.
+
+    stats(self)
+        Returns the collected counters and timings.
     """
 
-    def __init__(self, v_number):
+    def __init__(self, v_number, cache_size=DISTANCE_CACHE_SIZE, track_cycles=False):
         """
         Parameters
         ----------
         v_number : int
             an integer that represents the number of vertices.
+        cache_size : int or None
+            the maximum number of sources kept in the distance cache, None for
+            no limit and 0 to disable it.
+        track_cycles : bool
+            whether add_edge keeps a disjoint-set forest of the vertices, see
+            track_cycles().
         """
 
         self.v_number = v_number
         self.adj = {}
+        self.storage = None
+        self.has_negative_weight = False
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.matrix = None
+        self.components = None
+        self.component_index = {}
+        self.cycle_edge = None
+        self.profile = None
+        self.dynamic = False
+        self.tracked_sources = None
+        self.landmarks = None
+        if track_cycles:
+            self.track_cycles()
+
+    @classmethod
+    def from_txt(cls, path, compact=True):
+        """
+        Loads a graph from a .txt edge list file.
+
+        The first line has the number of vertices and every other non blank
+        line has two vertices and a weight. The file is read in large chunks
+        and parsed column by column straight into the compressed storage.
+
+        Parameters
+        ----------
+        path : str
+            the .txt file.
+        compact : bool
+            whether the graph keeps the compressed storage instead of an
+            adjacency list.
+
+        Returns
+        -------
+        the graph.
+
+        Raises
+        ------
+        ValueError
+            if a line is not formatted correctly, with its line number.
+        """
+
+        first = []
+        second = []
+        weights = []
+        with open(path) as f:
+            header = f.readline()
+            try:
+                v_number = int(header)
+            except ValueError:
+                raise ValueError(f"{path}, line 1: invalid number of vertices {header.strip()!r}") from None
+
+            line_number = 2
+            rest = ""
+            while True:
+                chunk = f.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    lines = [rest]
+                else:
+                    lines = (rest + chunk).split("\n")
+                    rest = lines.pop()
+                a, b, w = cls.parse_edge_lines(lines, line_number, path)
+                first += a
+                second += b
+                weights += w
+                line_number += len(lines)
+                if not chunk:
+                    break
+
+        return cls.from_storage(v_number, CSRStorage.from_edge_list(first, second, weights), compact)
+
+    @staticmethod
+    def parse_edge_lines(lines, first_line, path):
+        """
+        Helper function for from_txt.
+
+        Parameters
+        ----------
+        lines : list
+            the lines of a chunk.
+        first_line : int
+            the line number of the first line of the chunk.
+        path : str
+            the .txt file, used in the error messages.
+
+        Returns
+        -------
+        lists with the first vertices, the second vertices and the weights.
+        """
+
+        text = "\n".join(lines)
+        # cada linha precisa ter 3 colunas, contar só o total deixaria uma
+        # linha curta e uma longa se compensarem
+        if not BAD_EDGE_LINE.search(text):
+            tokens = text.split()
+            try:
+                return list(map(int, tokens[0::3])), list(map(int, tokens[1::3])), list(map(float, tokens[2::3]))
+            except ValueError:
+                pass
+
+        # o caminho rápido falhou, procura a linha com problema
+        for i, line in enumerate(lines):
+            columns = line.split()
+            if not columns:
+                continue
+            if len(columns) != 3:
+                raise ValueError(f"{path}, line {first_line + i}: expected 3 columns, found {len(columns)}")
+            try:
+                int(columns[0]), int(columns[1]), float(columns[2])
+            except ValueError:
+                raise ValueError(f"{path}, line {first_line + i}: invalid edge {line.strip()!r}") from None
+        raise ValueError(f"{path}: could not parse lines {first_line} to {first_line + len(lines) - 1}")
+
+    @classmethod
+    def from_storage(cls, v_number, storage, compact=True, has_negative_weight=None):
+        """
+        Builds a graph from a compressed storage.
+
+        Parameters
+        ----------
+        v_number : int
+            an integer that represents the number of vertices.
+        storage : CSRStorage
+            the compressed storage of the graph.
+        compact : bool
+            whether the graph keeps the compressed storage instead of an
+            adjacency list.
+        has_negative_weight : bool or None
+            whether some weight is negative, found from the weights if None.
+
+        Returns
+        -------
+        the graph.
+        """
+
+        graph = cls(v_number)
+        graph.storage = storage
+        graph.adj = CompactAdjacency(storage, Edge)
+        if has_negative_weight is None:
+            has_negative_weight = any(w < 0 for w in storage.weights)
+        graph.has_negative_weight = has_negative_weight
+        if not compact:
+            graph.adj = {label: list(edges) for label, edges in graph.adj.items()}
+        return graph
+
+    @classmethod
+    def from_snapshot(cls, path):
+        """
+        Opens a graph from a binary snapshot file.
+
+        The edges are memory-mapped instead of read, so the graph is compact
+        and opening it does not depend on its size. Landmark distances saved
+        next to the snapshot are opened too.
+
+        Parameters
+        ----------
+        path : str
+            the snapshot file.
+
+        Returns
+        -------
+        the graph.
+        """
+
+        v_number, storage, has_negative_weight = open_snapshot(path)
+        graph = cls.from_storage(v_number, storage, has_negative_weight=has_negative_weight)
+        if os.path.exists(path + LANDMARKS_SUFFIX):
+            graph.load_landmarks(path + LANDMARKS_SUFFIX)
+        return graph
+
+    def save_snapshot(self, path):
+        """
+        Saves the graph to a binary snapshot file.
+
+        Landmark distances, if computed, are saved next to it in the file
+        with the LANDMARKS_SUFFIX.
+
+        Parameters
+        ----------
+        path : str
+            the snapshot file.
+        """
+
+        write_snapshot(path, self.v_number, self.csr(), self.has_negative_weight)
+        if self.landmarks is not None:
+            self.save_landmarks(path + LANDMARKS_SUFFIX)
+
+    def compact(self):
+        """
+        Replaces the adjacency list with the compressed storage.
+
+        The edges are kept in flat arrays instead of one Edge object per
+        direction. Adding an edge to a compact graph turns it back into an
+        adjacency list.
+
+        Returns
+        -------
+        the graph itself.
+        """
+
+        if not self.is_compact():
+            self.adj = CompactAdjacency(self.csr(), Edge)
+        return self
+
+    def is_compact(self):
+        """
+        Returns if the graph is using the compressed storage.
+
+        Returns
+        -------
+        True if the graph is compact, False otherwise.
+        """
+
+        return isinstance(self.adj, CompactAdjacency)
+
+    def csr(self):
+        """
+        Returns the compressed sparse row storage of the graph.
+
+        Returns
+        -------
+        the CSRStorage of the graph.
+        """
+
+        if self.storage is None:
+            self.storage = CSRStorage.from_adjacency(self.adj)
+        return self.storage
 
     def get_vertex_sequence(self):
         """
@@ -156,6 +623,22 @@ class GraphWeighted:
             weight of the edge.
         """
 
+        if self.is_compact():
+            self.adj = {label: list(edges) for label, edges in self.adj.items()}
+        self.storage = None
+        if self.dynamic:
+            for source in list(self.cache):
+                # uma aresta negativa cria um ciclo negativo, as árvores são recalculadas
+                if not self.is_tracked(source) or (w < 0 and self.cache[source] is not None):
+                    del self.cache[source]
+        else:
+            self.cache.clear()
+        self.matrix = None
+        self.landmarks = None
+        if w < 0:
+            self.has_negative_weight = True
+        if self.components is not None:
+            self.track_edge(a, b, w)
         if a not in self.adj:
             self.adj[a] = []
         if b not in self.adj:
@@ -164,6 +647,30 @@ class GraphWeighted:
         self.adj[a].append(edge1)
         edge2 = Edge(a, w)
         self.adj[b].append(edge2)
+        if self.cache and w >= 0:
+            self.update_distances(a, b, w)
+
+    def track_edge(self, a, b, w):
+        """
+        Helper function for add_edge, joins the vertices of a new edge in the disjoint-set forest.
+
+        Parameters
+        ----------
+        a : int
+            first vertex.
+        b : int
+            second vertex.
+        w : float
+            weight of the edge.
+        """
+
+        index = self.component_index
+        if a not in index:
+            index[a] = self.components.add()
+        if b not in index:
+            index[b] = self.components.add()
+        if not self.components.union(index[a], index[b]) and self.cycle_edge is None:
+            self.cycle_edge = (a, b, w)
 
     def get_order(self):
         """
@@ -185,6 +692,9 @@ class GraphWeighted:
         size of the graph.
         """
 
+        if self.is_compact():
+            return self.storage.edge_count()
+
         size = 0
         for k, v in self.adj.items():
             size += len(v)
@@ -204,6 +714,10 @@ class GraphWeighted:
         list of neighbours.
         """
 
+        if self.is_compact():
+            labels = self.storage.labels
+            return [labels[t] for t in self.storage.neighbours(self.storage.index[v])]
+
         edges = []
         for edge in self.adj[v]:
             edges.append(edge.connected_vertex)
@@ -223,6 +737,8 @@ class GraphWeighted:
         degree of the vertex.
         """
 
+        if self.is_compact():
+            return self.storage.degree(self.storage.index[v])
         return len(self.adj[v])
 
     def degree_sequence(self):
@@ -235,15 +751,15 @@ class GraphWeighted:
         """
 
         degree = []
-        for k, v in self.adj.items():
-            degree.append(len(v))
+        for k in self.adj:
+            degree.append(self.degree_of_vertex(k))
 
         degree.sort(reverse=True)
         return degree
 
     def eccentricity(self, v):
         """
-        Returns the eccentricity of a vertex using bellman ford algorithm.
+        Returns the eccentricity of a vertex.
 
         Parameters
         ----------
@@ -255,7 +771,7 @@ class GraphWeighted:
         eccentricity of the vertex.
         """
 
-        distances = self.bellman_ford(v)
+        distances = self.shortest_distances(v)
 
         max_distance = 0
         for k, v in distances.items():
@@ -277,289 +793,1166 @@ class GraphWeighted:
         dictionary of distances.
         """
 
-        distances = {}
-        for k, v in self.adj.items():
-            distances[k] = float("inf")
-        distances[vertex] = 0
-        for i in range(self.v_number - 1):
-            for k, v in self.adj.items():
-                for edge in v:
-                    if distances[k] + edge.weight < distances[edge.connected_vertex]:
-                        distances[edge.connected_vertex] = distances[k] + edge.weight
-        for k, v in self.adj.items():
-            for edge in v:
-                if distances[k] + edge.weight < distances[edge.connected_vertex]:
-                    return 0
-        return distances
+        # a árvore acompanhada já tem as mesmas distâncias, sem refazer as passadas
+        if self.is_tracked(vertex):
+            result = self.single_source(vertex)
+            return 0 if result is None else dict(result[0])
 
-    def radius(self):
-        """
-        Returns the radius of the graph.
+        storage = self.csr()
+        result = self.bellman_ford_util(storage.index[vertex])
+        if result is None:
+            return 0
+        return dict(zip(storage.labels, result[0]))
 
-        Returns
-        -------
-        radius of the graph.
+    def bellman_ford_util(self, source):
         """
+        Helper function for bellman_ford.
 
-        radius = float("inf")
-        for k, v in self.adj.items():
-            eccentricity = self.eccentricity(k)
-            if eccentricity < radius:
-                radius = eccentricity
-        return radius
-
-    def diameter(self):
-        """
-        Returns the diameter of the graph.
+        Parameters
+        ----------
+        source : int
+            the id of the source vertex in the compressed storage.
 
         Returns
         -------
-        diameter of the graph.
+        lists of distances and predecessor ids indexed by vertex id, or None
+        if there is a negative cycle.
         """
 
-        maximum = 0
-        for k, v in self.adj.items():
-            e = self.eccentricity(k)
-            if e > maximum:
-                maximum = e
-        return maximum
-
-    def center(self):
+        storage = self.csr()
+        offsets = storage.offsets
+        targets = storage.targets
+        weights = storage.weights
+        n = storage.vertex_count()
+        inf = float("inf")
+
+        dist = [inf] * n
+        pred = [-1] * n
+        dist[source] = 0
+        passes = 0
+        relaxations = 0
+        for i in range(self.v_number - 1):
+            passes += 1
+            changed = False
+            for u in range(n):
+                du = dist[u]
+                if du == inf:
+                    continue
+                for e in range(offsets[u], offsets[u + 1]):
+                    if du + weights[e] < dist[targets[e]]:
+                        dist[targets[e]] = du + weights[e]
+                        pred[targets[e]] = u
+                        relaxations += 1
+                        changed = True
+            # nenhuma distância mudou, então as próximas passadas também não mudariam
+            if not changed:
+                break
+        if self.profile is not None:
+            self.profile.add("bellman_ford_passes", passes)
+            self.profile.add("relaxations", relaxations)
+        for u in range(n):
+            for e in range(offsets[u], offsets[u + 1]):
+                if dist[u] + weights[e] < dist[targets[e]]:
+                    return None
+        return dist, pred
+
+    def dijkstra(self, vertex):
         """
-        Returns the center of the graph.
+        Returns the distances of all vertices from a vertex using dijkstra algorithm.
+
+        The graph must not have edges with negative weight.
+
+        Parameters
+        ----------
+        vertex : int
+            a vertex.
 
         Returns
         -------
-        center of the graph.
+        dictionary of distances.
         """
 
-        center = []
-        r = self.radius()
-        for k, v in self.adj.items():
-            if self.eccentricity(k) == r:
-                center.append(k)
-        return center
+        storage = self.csr()
+        return dict(zip(storage.labels, self.dijkstra_util(storage.index[vertex])[0]))
 
-    def dfs(self, v):
+    def dijkstra_util(self, source):
         """
-        Returns the dfs of the graph.
+        Helper function for dijkstra.
 
         Parameters
         ----------
-        v : int
-            a vertex.
+        source : int
+            the id of the source vertex in the compressed storage.
 
         Returns
         -------
-        list of vertices in dfs order.
+        lists of distances and predecessor ids indexed by vertex id.
         """
 
-        visited = {}
-        sequence = []
-        self.dfs_util(v, visited, sequence)
-        return sequence
-
-    def dfs_util(self, v, visited, sequence):
+        storage = self.csr()
+        offsets = storage.offsets
+        targets = storage.targets
+        weights = storage.weights
+        n = storage.vertex_count()
+        inf = float("inf")
+
+        dist = [inf] * n
+        pred = [-1] * n
+        dist[source] = 0
+        heap = [(0, source)]
+        pushes = 0
+        while heap:
+            du, u = heapq.heappop(heap)
+            # entrada antiga da heap, o vértice já foi fechado com distância menor
+            if du > dist[u]:
+                continue
+            for e in range(offsets[u], offsets[u + 1]):
+                nd = du + weights[e]
+                t = targets[e]
+                if nd < dist[t]:
+                    dist[t] = nd
+                    pred[t] = u
+                    heapq.heappush(heap, (nd, t))
+                    pushes += 1
+        if self.profile is not None:
+            # a heap é esvaziada, então cada entrada inserida também foi removida
+            self.profile.add("relaxations", pushes)
+            self.profile.add("heap_pushes", pushes + 1)
+            self.profile.add("heap_pops", pushes + 1)
+        return dist, pred
+
+    def single_source(self, vertex):
         """
-        Helper function for dfs.
+        Returns the distances and predecessors of all vertices from a vertex.
+
+        Dijkstra is used when the graph has no negative edge, bellman ford
+        otherwise. Results are kept in the distance cache until an edge is
+        added, so they must not be modified by the caller.
 
         Parameters
         ----------
-        v : int
+        vertex : int
             a vertex.
-        visited : dict
-            dictionary of visited vertices.
-        sequence : list
-            list of vertices in dfs order.
 
         Returns
         -------
-        list of vertices in dfs order.
+        tuple with the dictionary of distances and the dictionary of
+        predecessors (None for the source and unreachable vertices), or None
+        if there is a negative cycle.
         """
 
-        visited[v] = True
-        sequence.append(v)
-        for edge in self.adj[v]:
-            if edge.connected_vertex not in visited:
-                self.dfs_util(edge.connected_vertex, visited, sequence)
-
-    def dfs_not_visited(self):
+        if vertex in self.cache:
+            if self.profile is not None:
+                self.profile.add("cache_hits")
+            self.cache.move_to_end(vertex)
+            return self.cache[vertex]
+        if self.profile is not None:
+            self.profile.add("cache_misses")
+
+        storage = self.csr()
+        result = self.single_source_util(storage.index[vertex])
+        if result is not None:
+            labels = storage.labels
+            dist, pred = result
+            predecessors = {}
+            for label, p in zip(labels, pred):
+                predecessors[label] = labels[p] if p >= 0 else None
+            result = (dict(zip(labels, dist)), predecessors)
+
+        pinned = self.tracked_sources if self.dynamic else None
+        if self.cache_size != 0 or (pinned is not None and vertex in pinned):
+            self.cache[vertex] = result
+            if self.cache_size is not None:
+                # as fontes passadas ao track_distances não contam no limite e nunca são descartadas
+                evictable = [source for source in self.cache if pinned is None or source not in pinned]
+                for source in evictable[:max(0, len(evictable) - self.cache_size)]:
+                    del self.cache[source]
+        return result
+
+    def single_source_util(self, source):
         """
-        Returns vertices that were not visited by the dfs.
+        Helper function for single_source, without the cache.
+
+        Parameters
+        ----------
+        source : int
+            the id of the source vertex in the compressed storage.
 
         Returns
         -------
-        list of vertices that were not visited by the dfs.
+        lists of distances and predecessor ids indexed by vertex id, or None
+        if there is a negative cycle.
         """
 
-        not_visited = []
-        for k, v in self.adj.items():
-            if k not in self.dfs(self.get_first_vertex()):
-                not_visited.append(k)
-        return not_visited
+        if self.has_negative_weight:
+            return self.bellman_ford_util(source)
+        return self.dijkstra_util(source)
 
-    def minimum_path(self, a, b):
+    def shortest_distances(self, vertex):
         """
-        Returns the minimum path between two vertices using dijkstra algorithm.
+        Returns the distances of all vertices from a vertex using the fastest valid algorithm.
 
         Parameters
         ----------
-        a : int
-            first vertex.
-        b : int
-            second vertex.
+        vertex : int
+            a vertex.
 
         Returns
         -------
-        list of vertices in the minimum path.
+        dictionary of distances, or 0 if there is a negative cycle.
         """
 
-        distances = self.bellman_ford(a)
-        path = [b]
-        # se não tiver caminho entre os dois vertices, retorna 0
-        if distances[b] == float("inf"):
+        result = self.single_source(vertex)
+        if result is None:
             return 0
-        while b != a:
-            for edge in self.adj[b]:
-                if distances[b] - edge.weight == distances[edge.connected_vertex]:
-                    path.append(edge.connected_vertex)
-                    b = edge.connected_vertex
-                    break
-        path.reverse()
-
-        ''''
-        while b != a:
-            for edge in self.adj[b]:
-                if distances[edge.connected_vertex] + edge.weight == distances[b]:
-                    b = edge.connected_vertex
-                    path.append(b)
-                    break
-        path.reverse()
-        '''
-        return path
+        return result[0]
 
-    def closeness_centrality(self, v):
+    def shortest_path_tree(self, source):
         """
-        Returns the closeness centrality of a vertex.
+        Returns the shortest paths from a vertex to all vertices.
+
+        The tree shares the cached single source result, so building it is
+        free once the distances are known and each path is read from the
+        predecessors in O(path length).
 
         Parameters
         ----------
-        v : int
+        source : int
             a vertex.
 
         Returns
         -------
-        closeness centrality of the vertex.
+        ShortestPathTree of the source, or None if there is a negative cycle.
         """
 
-        dist = self.bellman_ford(v)
-        sum_bf = 0
-        for k, v in dist.items():
-            sum_bf += v
-        if sum_bf == 0:
-            return 0
-        return (self.v_number - 1) / sum_bf
-
-    '''
-    TP02 - Questão 1
-    '''
+        result = self.single_source(source)
+        if result is None:
+            return None
+        return ShortestPathTree(source, *result)
 
-    def has_cycle(self):
+    def clear_cache(self):
         """
-        Returns if the graph has a cycle.
-
-        Returns
-        -------
-        True if the graph has a cycle, False otherwise.
+        Removes every result from the distance cache.
         """
 
-        for k, v in self.adj.items():
-            if self.has_cycle_util(k, k, {}):
-                return True
-        return False
+        self.cache.clear()
+        self.matrix = None
 
-    def has_cycle_util(self, v, parent, visited):
+    def track_distances(self, *vertices):
         """
-        Helper function for has_cycle.
+        Starts updating the distance trees of some sources on add_edge instead of dropping them.
+
+        A new edge can only shorten distances, so add_edge runs dijkstra from
+        its endpoints over the trees it improves and leaves the rest as they
+        are. A negative edge drops the trees and they are recomputed by the
+        next query. The trees of the given sources stay in the distance cache
+        outside its limit. Without vertices every cached source is tracked,
+        within the limit.
 
         Parameters
         ----------
-        v : int
-            a vertex.
-        parent : int
-            parent of the vertex.
-        visited : dict
-            dictionary of visited vertices.
+        vertices : int
+            the sources to track.
 
-        Returns
-        -------
-        True if the graph has a cycle, False otherwise.
+        Raises
+        ------
+        ValueError
+            if no vertex is given and the distance cache is disabled.
         """
 
-        visited[v] = True
-        for edge in self.adj[v]:
-            if edge.connected_vertex not in visited:
-                if self.has_cycle_util(edge.connected_vertex, v, visited):
-                    return True
-            elif edge.connected_vertex != parent:
-                return True
-        return False
-
-    '''
-    TP02 - Questão 3
-    '''
-
-    def vertex_list(self):
+        if not vertices and self.cache_size == 0:
+            raise ValueError("tracking every cached source needs the distance cache, cache_size is 0")
+        if not vertices:
+            self.tracked_sources = None
+        elif not self.dynamic:
+            self.tracked_sources = set(vertices)
+        elif self.tracked_sources is not None:
+            self.tracked_sources.update(vertices)
+        self.dynamic = True
+
+    def is_tracked(self, vertex):
         """
-        Returns a list of vertices.
+        Returns if the distance tree of a source is updated by add_edge.
+
+        Parameters
+        ----------
+        vertex : int
+            a vertex.
 
         Returns
         -------
-        list of vertices.
+        True if the source is tracked, False otherwise.
         """
 
-        return list(self.adj.keys())
+        return self.dynamic and (self.tracked_sources is None or vertex in self.tracked_sources)
 
-    def minimum_vertex_cover_heuristic(self):
+    def update_distances(self, a, b, w):
         """
-        Returns the minimum vertex cover of the graph using a heuristic.
+        Helper function for add_edge, propagates the improvements of a new edge through the tracked trees.
+
+        A tree that the edge improves is copied before the update, so results
+        returned before the edge was added do not change.
+
+        Parameters
+        ----------
+        a : int
+            first vertex.
+        b : int
+            second vertex.
+        w : float
+            weight of the edge, not negative.
+        """
+
+        inf = float("inf")
+        relaxations = 0
+        for source, result in list(self.cache.items()):
+            # com ciclo negativo o resultado continua None
+            if result is None:
+                continue
+            dist, pred = result
+            da = dist.get(a, inf)
+            db = dist.get(b, inf)
+            if da + w >= db and db + w >= da and a in dist and b in dist:
+                continue
+
+            dist = dict(dist)
+            pred = dict(pred)
+            for v in (a, b):
+                if v not in dist:
+                    dist[v] = inf
+                    pred[v] = None
+            heap = []
+            if da + w < db:
+                dist[b] = da + w
+                pred[b] = a
+                heap.append((da + w, b))
+            elif db + w < da:
+                dist[a] = db + w
+                pred[a] = b
+                heap.append((db + w, a))
+            while heap:
+                du, u = heapq.heappop(heap)
+                if du > dist[u]:
+                    continue
+                for edge in self.adj[u]:
+                    nd = du + edge.weight
+                    t = edge.connected_vertex
+                    if nd < dist[t]:
+                        dist[t] = nd
+                        pred[t] = u
+                        relaxations += 1
+                        heapq.heappush(heap, (nd, t))
+            self.cache[source] = (dist, pred)
+        if self.profile is not None:
+            self.profile.add("incremental_relaxations", relaxations)
+
+    def distance_matrix(self):
+        """
+        Returns the distances between all pairs of vertices using floyd warshall algorithm.
+
+        Requires numpy. Each iteration relaxes the whole matrix through one
+        intermediate vertex at once. Row and column i refer to the vertex
+        ``self.vertex_list()[i]``.
 
         Returns
         -------
-        the minimum vertex cover of the graph.
+        numpy matrix of distances, or 0 if there is a negative cycle.
         """
 
-        cover = []
-        nC = 0
+        if np is None:
+            raise ImportError("distance_matrix requires numpy")
+        if self.matrix is not None:
+            return self.matrix
+
+        storage = self.csr()
+        n = storage.vertex_count()
+        offsets = np.asarray(storage.offsets, dtype=np.int64)
+        sources = np.repeat(np.arange(n), np.diff(offsets))
+        targets = np.asarray(storage.targets, dtype=np.int64)
+        weights = np.asarray(storage.weights, dtype=np.float64)
+
+        dist = np.full((n, n), np.inf)
+        np.minimum.at(dist, (sources, targets), weights)
+        np.fill_diagonal(dist, np.minimum(dist.diagonal(), 0))
+        for k in range(n):
+            np.minimum(dist, dist[:, k, None] + dist[None, k, :], out=dist)
+
+        if (dist.diagonal() < 0).any():
+            self.matrix = 0
+        else:
+            self.matrix = dist
+        return self.matrix
 
-        V = self.vertex_list()
+    def use_distance_matrix(self):
+        """
+        Returns if the all pairs queries should use the distance matrix.
 
-        V.sort(key=lambda x: len(self.adj[x]), reverse=True)
+        The matrix is used when numpy is available and the graph is small and
+        dense enough for the floyd warshall iterations to beat one search per vertex.
 
-        M = []
-        for k, v in self.adj.items():
-            for edge in v:
-                M.append((k, edge.connected_vertex))
+        Returns
+        -------
+        True if the distance matrix should be used, False otherwise.
+        """
+
+        if np is None:
+            return False
+        storage = self.csr()
+        n = storage.vertex_count()
+        if n < 2 or n > DENSE_MAX_VERTICES:
+            return False
+        return storage.edge_count() >= DENSE_MIN_DENSITY * n * (n - 1) / 2
+
+    def all_eccentricities(self, workers=None, chunk_size=None):
+        """
+        Returns the eccentricity of every vertex.
+
+        Dense graphs are answered from the distance matrix. Otherwise, with
+        more than one worker, the source vertices are split into chunks and
+        computed in a process pool.
+
+        Parameters
+        ----------
+        workers : int or None
+            the number of worker processes, None or 1 to run in this process.
+        chunk_size : int or None
+            the number of source vertices sent to a worker at a time.
+
+        Returns
+        -------
+        dictionary of eccentricities.
+        """
+
+        if workers is None and self.use_distance_matrix():
+            matrix = self.distance_matrix()
+            if isinstance(matrix, np.ndarray):
+                return dict(zip(self.storage.labels, matrix.max(axis=1).tolist()))
+
+        eccentricities = {}
+        for chunk in map_source_chunks(self, eccentricity_chunk, list(self.adj), workers, chunk_size):
+            eccentricities.update(chunk)
+        return eccentricities
+
+    def worker_copy(self):
+        """
+        Returns a compact copy of the graph without cache, to be sent to worker processes.
+
+        Returns
+        -------
+        copy of the graph.
+        """
+
+        graph = GraphWeighted(self.v_number, cache_size=0)
+        graph.storage = self.csr()
+        graph.adj = CompactAdjacency(graph.storage, Edge)
+        graph.has_negative_weight = self.has_negative_weight
+        return graph
+
+    def radius(self, workers=None):
+        """
+        Returns the radius of the graph.
+
+        Parameters
+        ----------
+        workers : int or None
+            the number of worker processes used for the eccentricities.
+
+        Returns
+        -------
+        radius of the graph.
+        """
+
+        return min(self.all_eccentricities(workers).values(), default=float("inf"))
+
+    def diameter(self, workers=None):
+        """
+        Returns the diameter of the graph.
+
+        Parameters
+        ----------
+        workers : int or None
+            the number of worker processes used for the eccentricities.
+
+        Returns
+        -------
+        diameter of the graph.
+        """
+
+        return max(self.all_eccentricities(workers).values(), default=0)
+
+    def center(self, workers=None):
+        """
+        Returns the center of the graph.
+
+        Parameters
+        ----------
+        workers : int or None
+            the number of worker processes used for the eccentricities.
+
+        Returns
+        -------
+        center of the graph.
+        """
+
+        eccentricities = self.all_eccentricities(workers)
+        r = min(eccentricities.values(), default=float("inf"))
+        center = []
+        for k, e in eccentricities.items():
+            if e == r:
+                center.append(k)
+        return center
+
+    def dfs(self, v):
+        """
+        Returns the dfs of the graph.
+
+        Parameters
+        ----------
+        v : int
+            a vertex.
+
+        Returns
+        -------
+        list of vertices in dfs order.
+        """
+
+        storage = self.csr()
+        visited = bytearray(storage.vertex_count())
+        sequence = []
+        self.dfs_util(storage.index[v], visited, sequence)
+        labels = storage.labels
+        return [labels[i] for i in sequence]
+
+    def dfs_util(self, source, visited, sequence):
+        """
+        Helper function for dfs.
+
+        Uses an explicit stack, so long paths do not hit the recursion limit.
+
+        Parameters
+        ----------
+        source : int
+            the id of the first vertex in the compressed storage.
+        visited : bytearray
+            visited flag of each vertex id.
+        sequence : list
+            list of vertex ids in dfs order.
+        """
+
+        storage = self.csr()
+        offsets = storage.offsets
+        targets = storage.targets
+
+        visited[source] = 1
+        first = len(sequence)
+        sequence.append(source)
+        # cada entrada da pilha guarda o vértice e a próxima aresta a examinar
+        stack = [(source, offsets[source])]
+        while stack:
+            u, e = stack[-1]
+            end = offsets[u + 1]
+            while e < end and visited[targets[e]]:
+                e += 1
+            if e == end:
+                stack.pop()
+                continue
+            t = targets[e]
+            stack[-1] = (u, e + 1)
+            visited[t] = 1
+            sequence.append(t)
+            stack.append((t, offsets[t]))
+        if self.profile is not None:
+            self.profile.add("dfs_visits", len(sequence) - first)
+
+    def bfs(self, v):
+        """
+        Returns the bfs of the graph.
+
+        Parameters
+        ----------
+        v : int
+            a vertex.
+
+        Returns
+        -------
+        list of vertices in bfs order.
+        """
+
+        storage = self.csr()
+        visited = bytearray(storage.vertex_count())
+        sequence = []
+        self.bfs_util(storage.index[v], visited, sequence)
+        labels = storage.labels
+        return [labels[i] for i in sequence]
+
+    def bfs_util(self, source, visited, sequence):
+        """
+        Helper function for bfs.
+
+        Parameters
+        ----------
+        source : int
+            the id of the first vertex in the compressed storage.
+        visited : bytearray
+            visited flag of each vertex id.
+        sequence : list
+            list of vertex ids in bfs order, also used as the queue.
+        """
+
+        storage = self.csr()
+        offsets = storage.offsets
+        targets = storage.targets
+
+        visited[source] = 1
+        first = head = len(sequence)
+        sequence.append(source)
+        while head < len(sequence):
+            u = sequence[head]
+            head += 1
+            for t in targets[offsets[u]:offsets[u + 1]]:
+                if not visited[t]:
+                    visited[t] = 1
+                    sequence.append(t)
+        if self.profile is not None:
+            self.profile.add("bfs_visits", len(sequence) - first)
+
+    def component_ids(self):
+        """
+        Returns the connected component of every vertex id.
+
+        Components are numbered in the order of their first vertex, so the
+        component of the first vertex is 0.
+
+        Returns
+        -------
+        list of component numbers indexed by vertex id.
+        """
+
+        storage = self.csr()
+        n = storage.vertex_count()
+        visited = bytearray(n)
+        component = [0] * n
+        count = 0
+        for i in range(n):
+            if visited[i]:
+                continue
+            sequence = []
+            self.bfs_util(i, visited, sequence)
+            for u in sequence:
+                component[u] = count
+            count += 1
+        return component
+
+    def connected_components(self):
+        """
+        Returns the connected components of the graph.
+
+        Returns
+        -------
+        list of components, each one a list of vertices.
+        """
+
+        labels = self.csr().labels
+        components = []
+        for label, c in zip(labels, self.component_ids()):
+            if c == len(components):
+                components.append([])
+            components[c].append(label)
+        return components
+
+    def dfs_not_visited(self):
+        """
+        Returns vertices that were not visited by the dfs.
+
+        Returns
+        -------
+        list of vertices that were not visited by the dfs.
+        """
+
+        # a dfs do primeiro vértice visita exatamente a componente 0
+        labels = self.csr().labels
+        not_visited = []
+        for label, c in zip(labels, self.component_ids()):
+            if c != 0:
+                not_visited.append(label)
+        return not_visited
+
+    def minimum_path(self, a, b):
+        """
+        Returns the minimum path between two vertices using dijkstra algorithm.
+
+        Parameters
+        ----------
+        a : int
+            first vertex.
+        b : int
+            second vertex.
+
+        Returns
+        -------
+        list of vertices in the minimum path.
+        """
+
+        result = self.shortest_path(a, b)
+        # se não tiver caminho entre os dois vertices, retorna 0
+        if result is None or not result[1]:
+            return 0
+        return result[1]
+
+    def shortest_path(self, a, b, method=None):
+        """
+        Returns the distance and the shortest path between two vertices.
+
+        A cached distance tree of a answers directly. Otherwise both searches
+        settle only the vertices around the pair instead of the whole graph.
+        ALT (A* with landmark bounds) pays off on graphs with geometry, like
+        grids and road maps. On small world graphs the bounds are weak, so
+        bidirectional dijkstra is faster there. A graph with a negative edge
+        falls back to single_source.
+
+        Parameters
+        ----------
+        a : int
+            first vertex.
+        b : int
+            second vertex.
+        method : str or None
+            "alt" or "bidirectional", by default alt when the landmarks were
+            prepared and bidirectional otherwise.
+
+        Returns
+        -------
+        tuple with the distance and the list of vertices of the path (inf and
+        an empty list if there is no path), or None if there is a negative cycle.
+        """
+
+        if self.has_negative_weight or self.cache.get(a) is not None:
+            tree = self.shortest_path_tree(a)
+            if tree is None:
+                return None
+            return tree.distance(b), tree.path_to(b)
+
+        storage = self.csr()
+        if method is None:
+            method = "bidirectional" if self.landmarks is None else "alt"
+        if method == "alt":
+            if self.landmarks is None:
+                self.prepare_landmarks()
+            distance, ids = alt_search(storage, self.landmarks, storage.index[a], storage.index[b])
+        elif method == "bidirectional":
+            distance, ids = bidirectional_dijkstra(storage, storage.index[a], storage.index[b])
+        else:
+            raise ValueError(f"unknown shortest path method {method!r}")
+        labels = storage.labels
+        return distance, [labels[i] for i in ids]
+
+    def prepare_landmarks(self, count=8):
+        """
+        Computes the landmark distances used by shortest_path.
+
+        Landmarks are picked by farthest point: each new one is the vertex
+        farthest from the ones already picked, and a vertex unreachable from
+        all of them comes first, so every component gets a landmark. Each
+        landmark costs one dijkstra and n distances of memory.
+
+        Parameters
+        ----------
+        count : int
+            the number of landmarks.
+
+        Returns
+        -------
+        the landmark distances, or None if the graph has a negative edge.
+        """
+
+        if self.has_negative_weight:
+            return None
+        storage = self.csr()
+        n = storage.vertex_count()
+        ids = []
+        distances = []
+        # menor distância de cada vértice até os marcos já escolhidos
+        nearest = [float("inf")] * n
+        candidate = max(range(n), key=storage.degree, default=None)
+        while candidate is not None and len(ids) < count:
+            row = array("d", self.dijkstra_util(candidate)[0])
+            ids.append(candidate)
+            distances.append(row)
+            nearest = [min(x, y) for x, y in zip(nearest, row)]
+            candidate = max(range(n), key=nearest.__getitem__)
+            if nearest[candidate] == 0:
+                candidate = None
+        self.landmarks = Landmarks(ids, distances)
+        return self.landmarks
+
+    def save_landmarks(self, path):
+        """
+        Saves the landmark distances to a binary file.
+
+        Parameters
+        ----------
+        path : str
+            the landmarks file.
+        """
+
+        if self.landmarks is None and self.prepare_landmarks() is None:
+            raise ValueError("landmarks require a graph without negative edges")
+        write_landmarks(path, self.landmarks, self.csr().vertex_count())
+
+    def load_landmarks(self, path):
+        """
+        Opens the landmark distances from a binary file.
+
+        The ids must refer to the same compressed storage, which holds for a
+        file saved with the snapshot the graph was opened from.
+
+        Parameters
+        ----------
+        path : str
+            the landmarks file.
+
+        Returns
+        -------
+        the landmark distances.
+        """
+
+        self.landmarks = read_landmarks(path, self.csr().vertex_count())
+        return self.landmarks
+
+    def closeness_centrality(self, v):
+        """
+        Returns the closeness centrality of a vertex.
+
+        Uses the vertices actually stored, not the number in the file header,
+        and the Wasserman and Faust correction, so a vertex of a disconnected
+        graph is rated by the part it reaches, see closeness_from_distances.
+
+        Parameters
+        ----------
+        v : int
+            a vertex.
+
+        Returns
+        -------
+        closeness centrality of the vertex, or 0 if there is a negative cycle.
+        """
+
+        return self.vertex_centrality(v, False)
+
+    def harmonic_centrality(self, v):
+        """
+        Returns the harmonic centrality of a vertex.
+
+        The sum of 1 / d over the other vertices, which is well defined on
+        disconnected graphs because unreachable vertices add 0.
+
+        Parameters
+        ----------
+        v : int
+            a vertex.
+
+        Returns
+        -------
+        harmonic centrality of the vertex, or 0 if there is a negative cycle.
+        """
+
+        return self.vertex_centrality(v, True)
+
+    def vertex_centrality(self, v, harmonic):
+        """
+        Helper function for closeness_centrality and harmonic_centrality.
 
-        while len(M) != 0:
+        Parameters
+        ----------
+        v : int
+            a vertex.
+        harmonic : bool
+            whether to compute the harmonic centrality.
 
-            k = V[0]
+        Returns
+        -------
+        centrality of the vertex, or 0 if there is a negative cycle.
+        """
+
+        # só lê a matriz já calculada, montá-la para um único vértice custa O(n³)
+        if self.matrix is not None:
+            if not isinstance(self.matrix, np.ndarray):
+                return 0
+            return closeness_from_distances(self.matrix[self.csr().index[v]].tolist(), len(self.matrix), harmonic)
 
-            V.remove(k)
-            cover.append(k)
+        dist = self.shortest_distances(v)
+        if dist == 0:
+            return 0
+        return closeness_from_distances(dist.values(), len(dist), harmonic)
 
-            neighborsofK = []
-            for edge in self.adj[k]:
-                neighborsofK.append(edge.connected_vertex)
+    def all_closeness(self, harmonic=False, epsilon=None, seed=None, workers=None, chunk_size=None):
+        """
+        Returns the closeness, or harmonic, centrality of every vertex.
 
-            for v in neighborsofK:
-                for a in M:
-                    if (k, v) in M:
-                        M.remove((k, v))
-                    if (v, k) in M:
-                        M.remove((v, k))
-            nC += 1
-        return cover
+        The exact values take one search per vertex not in the distance
+        cache, without filling it, or come from the distance matrix when the
+        graph is dense.
+        With epsilon the Eppstein–Wang estimate runs only log(n) / epsilon²
+        searches from random sources and spreads their distances to every
+        vertex, the error of each average distance being at most epsilon
+        times the diameter with high probability.
+
+        Parameters
+        ----------
+        harmonic : bool
+            whether to compute the harmonic centrality.
+        epsilon : float or None
+            the error of the sampled estimate, None for the exact values.
+        seed : int or None
+            the seed of the sampled sources.
+        workers : int or None
+            the number of worker processes for the searches.
+        chunk_size : int or None
+            the number of sources sent to a worker at a time.
+
+        Returns
+        -------
+        dictionary of centralities, or 0 if there is a negative cycle.
+        """
+
+        storage = self.csr()
+        labels = storage.labels
+        n = storage.vertex_count()
+        if epsilon is not None:
+            k = sample_size(n, epsilon)
+            samples = random.Random(seed).sample(range(n), k)
+            sampled = bytearray(n)
+            for s in samples:
+                sampled[s] = 1
+            sums = [0.0] * n
+            reached = [0] * n
+            function = functools.partial(sample_chunk, harmonic=harmonic)
+            for chunk in map_source_chunks(self, function, samples, workers, chunk_size):
+                if chunk is None:
+                    return 0
+                sums = [a + b for a, b in zip(sums, chunk[0])]
+                reached = [a + b for a, b in zip(reached, chunk[1])]
+            return dict(zip(labels, sampled_closeness(sums, reached, sampled, k, n, harmonic)))
+
+        if workers is None and self.use_distance_matrix():
+            matrix = self.distance_matrix()
+            if not isinstance(matrix, np.ndarray):
+                return 0
+            finite = np.isfinite(matrix)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                if harmonic:
+                    values = np.where(finite & (matrix > 0), 1 / matrix, 0).sum(axis=1)
+                else:
+                    reachable = finite.sum(axis=1) - 1
+                    total = np.where(finite, matrix, 0).sum(axis=1)
+                    values = np.where(total > 0, (reachable / total) * (reachable / max(n - 1, 1)), 0)
+            return dict(zip(labels, values.tolist()))
+
+        result = {}
+        function = functools.partial(closeness_chunk, harmonic=harmonic)
+        for chunk in map_source_chunks(self, function, list(labels), workers, chunk_size):
+            for v, c in chunk:
+                if c is None:
+                    return 0
+                result[v] = c
+        return result
+
+    def betweenness_centrality(self, normalized=True, k=None, seed=None, weighted=None, workers=None, chunk_size=None):
+        """
+        Returns the betweenness centrality of every vertex.
+
+        Uses Brandes' algorithm, one search per source, with dijkstra on
+        weighted graphs and bfs when every edge has the same weight. The
+        sources are split in chunks that can run in worker processes, each
+        returning its partial vector, and the vectors are summed at the end.
+        With k only k random sources are searched and the result is scaled by
+        n / k, which is how graphs with hundreds of thousands of vertices fit
+        in a reasonable time.
+
+        Parameters
+        ----------
+        normalized : bool
+            whether to divide by the (n - 1)(n - 2) / 2 pairs that do not
+            include the vertex.
+        k : int or None
+            the number of sampled sources, None to use every vertex.
+        seed : int or None
+            the seed of the sampled sources.
+        weighted : bool or None
+            whether to use the weights, by default only if they are not all equal.
+        workers : int or None
+            the number of worker processes for the searches.
+        chunk_size : int or None
+            the number of sources sent to a worker at a time.
+
+        Returns
+        -------
+        dictionary of centralities, or 0 if there is a negative cycle.
+        """
+
+        # uma aresta negativa em um grafo não direcionado é um ciclo negativo
+        if self.has_negative_weight:
+            return 0
+        storage = self.csr()
+        n = storage.vertex_count()
+        if weighted is None:
+            weighted = len(set(storage.weights)) > 1
+        if k is None or k >= n:
+            sources = list(range(n))
+        else:
+            sources = random.Random(seed).sample(range(n), k)
+
+        centrality = [0.0] * n
+        function = functools.partial(betweenness_chunk, weighted=weighted)
+        for chunk in map_source_chunks(self, function, sources, workers, chunk_size):
+            centrality = [a + b for a, b in zip(centrality, chunk)]
+
+        # cada par foi contado pelas duas pontas
+        scale = 0.5 * n / len(sources) if sources else 0
+        if normalized:
+            scale = 0 if n <= 2 else scale * 2 / ((n - 1) * (n - 2))
+        return {label: c * scale for label, c in zip(storage.labels, centrality)}
+
+    '''
+    TP02 - Questão 1
+    '''
+
+    def has_cycle(self):
+        """
+        Returns if the graph has a cycle.
+
+        With cycle tracking enabled this is answered in constant time,
+        otherwise the edges are joined in a disjoint-set forest in one pass.
+
+        Returns
+        -------
+        True if the graph has a cycle, False otherwise.
+        """
+
+        return self.find_cycle_edge() is not None
+
+    def find_cycle_edge(self):
+        """
+        Returns an edge that closes a cycle.
+
+        With cycle tracking enabled it is the first such edge added.
+
+        Returns
+        -------
+        tuple (a, b, w) of the edge, or None if the graph has no cycle.
+        """
+
+        if self.components is not None:
+            return self.cycle_edge
+
+        storage = self.csr()
+        offsets = storage.offsets
+        targets = storage.targets
+        n = storage.vertex_count()
+        sets = DisjointSet(n)
+        for u in range(n):
+            for e in range(offsets[u], offsets[u + 1]):
+                t = targets[e]
+                # cada aresta aparece nas duas direções, um laço já fecha um ciclo
+                if u <= t:
+                    if not sets.union(u, t):
+                        if self.profile is not None:
+                            self.profile.add("cycle_check_visits", u + 1)
+                        return storage.labels[u], storage.labels[t], storage.weights[e]
+        if self.profile is not None:
+            self.profile.add("cycle_check_visits", n)
+        return None
+
+    def track_cycles(self):
+        """
+        Starts keeping a disjoint-set forest of the vertices updated by add_edge.
+
+        Afterwards has_cycle, find_cycle_edge and component_count are answered
+        in constant time.
+        """
+
+        if self.components is not None:
+            return
+        self.cycle_edge = self.find_cycle_edge()
+        storage = self.csr()
+        self.component_index = dict(storage.index)
+        self.components = DisjointSet(storage.vertex_count())
+        offsets = storage.offsets
+        targets = storage.targets
+        for u in range(storage.vertex_count()):
+            for e in range(offsets[u], offsets[u + 1]):
+                self.components.union(u, targets[e])
+
+    def component_count(self):
+        """
+        Returns the number of connected components of the graph.
+
+        Returns
+        -------
+        number of connected components.
+        """
+
+        if self.components is not None:
+            return self.components.count
+        return len(self.connected_components())
+
+    '''
+    TP02 - Questão 3
+    '''
+
+    def vertex_list(self):
+        """
+        Returns a list of vertices.
+
+        Returns
+        -------
+        list of vertices.
+        """
+
+        return list(self.adj.keys())
+
+    def minimum_vertex_cover_heuristic(self):
+        """
+        Returns the minimum vertex cover of the graph using a heuristic.
+
+        Returns
+        -------
+        the minimum vertex cover of the graph.
+        """
+
+        return self.vertex_cover().vertices
+
+    def vertex_cover(self, method="greedy", time_limit=None):
+        """
+        Returns a vertex cover of the graph.
+
+        Parameters
+        ----------
+        method : str
+            "greedy" picks the vertex with most uncovered edges each time,
+            "matching" takes both ends of a maximal matching (at most twice
+            the minimum) and "exact" searches for a minimum cover.
+        time_limit : float or None
+            the maximum number of seconds of the exact search, None for no
+            limit. When it runs out the best cover found is returned.
+
+        Returns
+        -------
+        the VertexCover with the vertices and its size.
+        """
+
+        storage = self.csr()
+        optimal = False
+        if method == "greedy":
+            cover = greedy_cover(storage)
+        elif method == "matching":
+            cover = matching_cover(storage)
+        elif method == "exact":
+            cover, optimal = exact_cover(storage, time_limit)
+        else:
+            raise ValueError(f"unknown vertex cover method {method!r}")
+        labels = storage.labels
+        return VertexCover([labels[u] for u in cover], method, optimal)
 
 
 
@@ -590,63 +1983,36 @@ class GraphWeighted:
 
     def minimum_spanning_tree(self, s):
         """
-        Returns a txt file with the minimum spanning tree of the graph.
+        Returns the minimum spanning tree of the graph and writes it to a txt file.
+
+        Uses kruskal algorithm with a disjoint-set forest. If the graph is not
+        connected the result is a minimum spanning forest, with one tree per
+        connected component.
 
         Parameters
         ----------
         s : string
-            name for the file that will be created.
+            name of the graph file, the tree is written to the same name ending in MST.txt.
 
         Returns
         -------
-        Weather or not it was possible to make the minimum spanning tree of the graph.
+        the SpanningTree with the edges and the total weight.
         """
 
-        V = self.vertex_list()
-        T = []
-        T.append(self.get_first_vertex())
-        V.pop(0)
-        Tmin = []
-        c = 0
+        tree = self.minimum_spanning_forest()
+        tree.write(s.removesuffix('.txt') + 'MST.txt', self.v_number)
+        return tree
 
-        while len(T) < self.v_number:
-            found = False
-            for j in T:
-                for k in V:
-                    if k in self.get_neighbours(j):
-                        minW = self.edge_weight(j, k)
-                        v = j
-                        w = k
-                        found = True
-                        break
-                if found:
-                    break
-            if found:
-                for j in T:
-                    for k in V:
-                        if k in self.get_neighbours(j):
-                            if self.edge_weight(j, k) < minW:
-                                minW = self.edge_weight(j, k)
-                                v = j
-                                w = k
-                Tmin.append(f"{v} {w} {self.edge_weight(v, w)}")
-                T.append(w)
-                V.remove(w)
-                c += self.edge_weight(v, w)
-            else:
-                break
-        if found:
-            s = s.removesuffix('.txt')
-            s = s + 'MST.txt'
-            with open(s, 'w') as f:
-                f.write(f"{self.v_number}\n")
-                f.write(f"{c}\n")
-                for i in range (self.v_number - 1):
-                    f.write(f"{Tmin[i]}\n")
-            f.close()
-            return True
-        else:
-            return False
+    def minimum_spanning_forest(self):
+        """
+        Returns the minimum spanning forest of the graph.
+
+        Returns
+        -------
+        the SpanningTree with the edges and the total weight.
+        """
+
+        return kruskal(self.csr())
 
     """"
     TP02 - Questão 4
@@ -657,26 +2023,84 @@ class GraphWeighted:
         """
         Returns the maximum matching of the graph.
 
+        Uses hopcroft karp algorithm when the graph is bipartite and edmonds
+        blossom algorithm otherwise.
+
         Returns
         -------
-        the maximum matching of the graph.
+        list of (a, b) pairs of matched vertices.
         """
 
-        
+        storage = self.csr()
+        side = bipartition(storage)
+        if side is not None:
+            mate = hopcroft_karp(storage, side)
+        else:
+            mate = edmonds_blossom(storage)
+
+        labels = storage.labels
         matches = []
-        vertices = self.vertex_list()
-        not_matched = vertices
-        matched = []
-        while not_matched:
-            for v in not_matched:
-                for edge in self.adj[v]:
-                    if v not in matched:
-                        matches.append(v)
-                        not_matched.remove(v)
-                        matched.append(v)
-                    if edge.connected_vertex not in matched:
-                        matches.append(edge.connected_vertex)
-                        not_matched.remove(edge.connected_vertex)
-                        matched.append(edge.connected_vertex)
-                        break
+        for u, m in enumerate(mate):
+            if u < m:
+                if side is not None and side[u] == 1:
+                    matches.append((labels[m], labels[u]))
+                else:
+                    matches.append((labels[u], labels[m]))
         return matches
+
+    def is_bipartite(self):
+        """
+        Returns if the graph is bipartite.
+
+        Returns
+        -------
+        True if the graph is bipartite, False otherwise.
+        """
+
+        return bipartition(self.csr()) is not None
+
+    def enable_profiling(self):
+        """
+        Starts counting the hot path operations and timing the methods.
+
+        Every method in PROFILED_METHODS is shadowed by a timed wrapper on this
+        instance only, so a graph without profiling pays nothing for it.
+
+        Returns
+        -------
+        the GraphStats where the statistics are collected.
+        """
+
+        if self.profile is None:
+            self.profile = GraphStats()
+            for name in PROFILED_METHODS:
+                setattr(self, name, profiled(self.profile, name, getattr(self, name)))
+        return self.profile
+
+    def disable_profiling(self):
+        """
+        Stops the profiling and drops the collected statistics.
+        """
+
+        if self.profile is not None:
+            for name in PROFILED_METHODS:
+                del self.__dict__[name]
+            self.profile = None
+
+    def stats(self):
+        """
+        Returns the collected counters and timings.
+
+        The counters are relaxations, bellman_ford_passes, heap_pushes,
+        heap_pops, cache_hits, cache_misses, dfs_visits, bfs_visits and
+        cycle_check_visits. The times of a method include the methods it calls.
+
+        Returns
+        -------
+        dictionary with the counters and, for each method, its calls and
+        seconds. Both are empty when profiling is disabled.
+        """
+
+        if self.profile is None:
+            return {"counters": {}, "methods": {}}
+        return self.profile.as_dict()
@@ -1,24 +1,50 @@
-import random
+import argparse
+import sys
 
+from functions.generators import KINDS, generate_file, generate_graphs
 
-def generate_graph(n, p):
+
+def parse_arguments():
     """
-    Generates a graph with n vertices and p probability.
+    Returns the command line arguments of the non interactive mode.
+
+    Exits with a usage error if a parameter required by the kind of graph
+    is missing.
     """
-    with open(f"txt-files/graph-{n}-{p}.txt", "w") as f:
-        f.write(str(n) + "\n")
-        for i in range(n):
-            for j in range(i + 1, n):
-                if random.random() < p:
-                    f.write(str(i) + " " + str(j) + " " + str(random.randint(1, 100)) + "\n")
+
+    parser = argparse.ArgumentParser(description="Generates synthetic graphs in the .txt format.")
+    parser.add_argument("kind", choices=list(KINDS))
+    parser.add_argument("output", help="the .txt file")
+    parser.add_argument("--n", type=int, help="number of vertices")
+    parser.add_argument("--p", type=float, help="edge probability (gnp)")
+    parser.add_argument("--m", type=int, help="edges of each new vertex (barabasi_albert)")
+    parser.add_argument("--rows", type=int, help="rows (grid)")
+    parser.add_argument("--cols", type=int, help="columns (grid)")
+    parser.add_argument("--radius", type=float, help="connection distance (geometric)")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    missing = [f"--{name}" for name in KINDS[args.kind] if getattr(args, name) is None]
+    if missing:
+        parser.error(f"{args.kind} requires {' '.join(missing)}")
+    return args
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        args = parse_arguments()
+        params = {name: getattr(args, name) for name in KINDS[args.kind]}
+        print(f"Done! {generate_file(args.kind, args.output, args.seed, **params)}")
+        sys.exit()
+
     print("Generating graph...")
     print("Number of vertexes: ", end="")
     n = int(input())
     print("Probability: ", end="")
     p = float(input())
-    for i in range(100):
-        generate_graph(n, p)
-    print("Done!")
+    print("Number of graphs: ", end="")
+    count = int(input())
+    print("Seed (empty for random): ", end="")
+    seed = input().strip()
+    paths = generate_graphs(n, p, count, int(seed) if seed else None)
+    print(f"Done! {len(paths)} files written, the first is {paths[0]}" if paths else "Done!")
@@ -1,6 +1,8 @@
 import os
+import sys
 
 from functions.converter import *
+from functions.profiling import format_stats
 from functions.weighted_graph import *
 
 
@@ -14,15 +16,15 @@ while True:
     except:
         print("File not found!")
 
-with open(file) as f:
-    try:
-        v_number = int(f.readline())
-        graph = GraphWeighted(v_number)
-        for line in f:
-            a, b, w = line.split()
-            graph.add_edge(int(a), int(b), float(w))
-    except:
-        print("File not formatted correctly!")
+try:
+    graph = GraphWeighted.from_txt(file)
+except ValueError as e:
+    print(f"File not formatted correctly! {e}")
+    sys.exit(1)
+
+# python3 main.py --profile mostra contadores e tempos de cada método no final
+if "--profile" in sys.argv:
+    graph.enable_profiling()
 
 sequence = graph.get_vertex_sequence()
 first = graph.get_first_vertex()
@@ -51,33 +53,43 @@ print(f"DFS traversal: {graph.dfs(first)}")
 print("\nNot visited in DFS")
 print(f"Not visited in DFS: {graph.dfs_not_visited()}")
 
-if graph.bellman_ford(first) == 0:
+if graph.shortest_distances(first) == 0:
     print("Negative cycle detected!")
 else:
+    # uma única varredura de todas as fontes serve para raio, centro e diâmetro
+    eccentricities = graph.all_eccentricities()
+    radius = min(eccentricities.values(), default=float("inf"))
     print("\nEccentricities")
     for v in sequence:
-        print(f"Eccentricity of {v}: {graph.eccentricity(v)}")
+        print(f"Eccentricity of {v}: {eccentricities[v]}")
 
     print("\nRadius")
-    print(f"Radius of the graph: {graph.radius()}")
+    print(f"Radius of the graph: {radius}")
 
     print("\nCenter")
-    print(f"Center of the graph: {graph.center()}")
+    print(f"Center of the graph: {[v for v, e in eccentricities.items() if e == radius]}")
 
     print("\nDiameter")
-    print(f"Diameter of the graph: {graph.diameter()}")
+    print(f"Diameter of the graph: {max(eccentricities.values(), default=0)}")
 
+    tree = graph.shortest_path_tree(first)
     print("\nDistances")
     for v in sequence:
-        print(f"Distance from {first} to {v}: {graph.bellman_ford(first)[v]}")
+        print(f"Distance from {first} to {v}: {tree.distance(v)}")
 
     print("\nMinimum path")
     for v in sequence:
-        print(f"Minimum path between {first} and {v}: {graph.minimum_path(first, v)}")
+        # sem caminho entre os dois vértices mostra 0, como o minimum_path
+        print(f"Minimum path between {first} and {v}: {tree.path_to(v) or 0}")
 
+    closeness = graph.all_closeness()
     print("\nCloseness centralities")
     for v in sequence:
-        print(f"Closeness centrality of {v}: {graph.closeness_centrality(v)}")
+        print(f"Closeness centrality of {v}: {closeness[v]}")
+
+if graph.profile is not None:
+    print("\nProfile")
+    print(format_stats(graph.stats()))
 
 print("\n\nJson to text?")
 print("1. Yes")
@@ -1,6 +1,8 @@
 import os
+import sys
 
 from functions.converter import *
+from functions.profiling import format_stats
 from functions.weighted_graph import *
 
 
@@ -14,15 +16,15 @@ while True:
     except FileNotFoundError:
         print("File not found!")
 
-with open(file) as f:
-    try:
-        v_number = int(f.readline())
-        graph = GraphWeighted(v_number)
-        for line in f:
-            a, b, w = line.split()
-            graph.add_edge(int(a), int(b), float(w))
-    except:
-        print("File not formatted correctly!")
+try:
+    graph = GraphWeighted.from_txt(file)
+except ValueError as e:
+    print(f"File not formatted correctly! {e}")
+    sys.exit(1)
+
+# python3 main2.py --profile mostra contadores e tempos de cada método no final
+if "--profile" in sys.argv:
+    graph.enable_profiling()
 
 sequence = graph.get_vertex_sequence()
 first = graph.get_first_vertex()
@@ -32,14 +34,24 @@ print(
     f"Has cycle?: {graph.has_cycle()}\n"
 )
 
-if graph.minimum_spanning_tree(file):
+tree = graph.minimum_spanning_tree(file)
+if tree.is_tree():
     print("Minimum Spanning Tree\n"
+          f"Total weight: {tree.weight}\n"
           f"File name: {file.removesuffix('.txt')}MST.txt\n")
 else:
-    print("Not possible to make Minimum Spanning Tree\n")
+    print("Graph is not connected, Minimum Spanning Forest\n"
+          f"Trees: {tree.components}, total weight: {tree.weight}\n"
+          f"File name: {file.removesuffix('.txt')}MST.txt\n")
 
+cover = graph.vertex_cover()
 print("Minimum Vertex Cover\n"
-      f"Final result: {graph.minimum_vertex_cover_heuristic()}, with {len(graph.minimum_vertex_cover_heuristic())} vertices\n")
+      f"Final result: {cover.vertices}, with {cover.size} vertices\n")
 
+matching = graph.maximum_matching()
 print(f"Maximum matching\n"
-      f"Final result: {graph.maximum_matching()} \n")
+      f"Final result: {matching}, with {len(matching)} edges\n")
+
+if graph.profile is not None:
+    print("\nProfile")
+    print(format_stats(graph.stats()))